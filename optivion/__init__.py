@@ -0,0 +1,6 @@
+"""Optivion — analog & light-based computation sandbox.
+
+Pages live in ``optivion.pages`` and are imported lazily by ``app.py`` the
+first time they are shown, so heavy dependencies (matplotlib, sklearn) are
+only paid for by the pages that need them.
+"""
@@ -0,0 +1,5 @@
+import sys
+
+from optivion.cli import main
+
+sys.exit(main())
@@ -0,0 +1,173 @@
+"""Precomputed (wavelength, phase) atlas of 2D interference fields.
+
+The Interference sliders span a small finite grid — wavelength 1.0–10.0 in
+steps of 0.1 and phase 0–359 degrees — so every field for one resolution
+fits in a single memory-mapped ``uint8`` array of shape
+``(91, 360, size, size)`` (~537 MB at 128², ~2.1 GB at 256²). A parallel
+boolean mask records which entries are filled, so a partially built atlas
+is usable and a restarted build picks up where it stopped. Worker
+processes share the files; an advisory lock lets exactly one of them run
+the build while the others read what it has filled so far.
+"""
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process deployments only
+    fcntl = None
+
+from optivion.fields import generate_2d_field
+
+WAVELENGTHS = np.round(np.arange(1.0, 10.0 + 1e-9, 0.1), 1)
+PHASES = np.arange(360)
+SEPARATION = 10.0
+
+DEFAULT_DIR = Path(os.environ.get("OPTIVION_ATLAS_DIR", Path.home() / ".cache" / "optivion" / "atlas"))
+
+
+# Helper: open (and lock, if fcntl exists) ``path``; returns the fd. ``blocking=False``
+# returns None when another process holds the lock
+def _lock(path, blocking=True):
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    if fcntl is None:
+        return fd
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _unlock(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+# Helper: create a .npy memmap once across processes (under a lock, built in a
+# temp file and renamed, so nobody maps a half-written header or a replaced inode)
+def _open_or_create(path, shape, dtype):
+    fd = _lock(path.with_name(f".{path.name}.lock"))
+    try:
+        if not path.exists():
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            arr = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=shape)
+            del arr
+            os.replace(tmp, path)
+    finally:
+        _unlock(fd)
+    return np.lib.format.open_memmap(path, mode="r+")
+
+
+class FieldAtlas:
+    """All (wavelength, phase) fields for one resolution, backed by disk."""
+
+    def __init__(self, size, directory=DEFAULT_DIR):
+        self.size = int(size)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.frames = _open_or_create(
+            self.directory / f"fields_{self.size}.npy",
+            (len(WAVELENGTHS), len(PHASES), self.size, self.size),
+            np.uint8,
+        )
+        self.filled = _open_or_create(
+            self.directory / f"filled_{self.size}.npy",
+            (len(WAVELENGTHS), len(PHASES)),
+            np.bool_,
+        )
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    # Map slider values to grid indices; None when off-grid
+    @staticmethod
+    def index(wavelength, phase_diff_deg):
+        wi = int(round((float(wavelength) - WAVELENGTHS[0]) / 0.1))
+        if not 0 <= wi < len(WAVELENGTHS) or abs(WAVELENGTHS[wi] - wavelength) > 1e-6:
+            return None
+        ph = float(phase_diff_deg) % 360
+        pi = int(round(ph)) % 360
+        if abs(ph - round(ph)) > 1e-6:
+            return None
+        return wi, pi
+
+    # O(1) lookup; returns None if the entry is off-grid or not built yet
+    def lookup(self, wavelength, phase_diff_deg):
+        idx = self.index(wavelength, phase_diff_deg)
+        if idx is None or not self.filled[idx]:
+            return None
+        return np.asarray(self.frames[idx])
+
+    # Atlas entry if present, else compute live (and store it)
+    def get(self, wavelength, phase_diff_deg):
+        arr = self.lookup(wavelength, phase_diff_deg)
+        if arr is not None:
+            return arr
+        arr = generate_2d_field(wavelength=wavelength, phase_diff_deg=float(phase_diff_deg) % 360,
+                                size=self.size, separation=SEPARATION)
+        idx = self.index(wavelength, phase_diff_deg)
+        if idx is not None:
+            self._store(idx, arr)
+        return arr
+
+    def _store(self, idx, arr):
+        with self._lock:
+            self.frames[idx] = arr
+            self.filled[idx] = True  # flag after data so readers never see a half frame
+
+    @property
+    def progress(self):
+        return float(self.filled.mean())
+
+    # Fill every missing entry; wavelengths nearest ``around`` first
+    def build(self, around=None, on_progress=None):
+        order = np.arange(len(WAVELENGTHS))
+        if around is not None:
+            order = order[np.argsort(np.abs(WAVELENGTHS - around), kind="stable")]
+        for wi in order:
+            if self._stop.is_set():
+                break
+            missing = np.flatnonzero(~self.filled[wi])
+            for pi in missing:
+                if self._stop.is_set():
+                    break
+                arr = generate_2d_field(wavelength=float(WAVELENGTHS[wi]), phase_diff_deg=float(PHASES[pi]),
+                                        size=self.size, separation=SEPARATION)
+                self._store((wi, pi), arr)
+            self.frames.flush()
+            self.filled.flush()
+            if on_progress is not None:
+                on_progress(self.progress)
+
+    # Start build() on a daemon thread. No-op if already running here, complete,
+    # or being built by another process (which releases the lock when it exits).
+    def build_in_background(self, around=None):
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        if self.filled.all():
+            return None
+        fd = _lock(self.directory / f".build_{self.size}.lock", blocking=False)
+        if fd is None:
+            return None
+
+        def run():
+            try:
+                self.build(around=around)
+            finally:
+                _unlock(fd)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=run, name=f"optivion-atlas-{self.size}", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
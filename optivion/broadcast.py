@@ -0,0 +1,152 @@
+"""Cross-session frame broadcasting.
+
+Sessions playing the same animation with the same parameters (e.g. the
+default Interference view) share one ``FrameStream``: a producer thread
+renders each frame once into a small shared cache and every subscriber
+reads from it. Subscribers are reference counted per session and hold a
+lease that is refreshed on every read, so a session that stops or
+disconnects drops out after ``LEASE_SECONDS`` and the producer exits when
+nobody is watching. CPU therefore scales with the number of distinct
+parameter sets, not with the number of viewers.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+LEASE_SECONDS = 5.0
+LOOKAHEAD = 4
+MAX_FRAMES = 64
+WAIT_SECONDS = 2.0
+
+
+class FrameStream:
+    """Frames ``render(index)`` for one parameter set, shared by subscribers."""
+
+    def __init__(self, key, render, period=None, on_exit=None):
+        self.key = key
+        self.render = render
+        self.period = period
+        self.frames = OrderedDict()
+        self.subscribers = {}  # session id -> (frame index, last seen)
+        self.rendered = 0
+        self.seconds = {}  # frame index -> seconds the producer took to render it
+        self.last_seconds = None
+        self._on_exit = on_exit
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def index(self, tick):
+        return tick % self.period if self.period else tick
+
+    def subscribe(self, session_id, tick):
+        with self._cond:
+            self.subscribers[session_id] = (self.index(tick), time.monotonic())
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._produce, name=f"optivion-stream-{self.key}", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def unsubscribe(self, session_id):
+        with self._cond:
+            self.subscribers.pop(session_id, None)
+            self._cond.notify_all()
+
+    # Wait (bounded) for the producer to deliver frame ``index``; returns (frame or None,
+    # its render seconds, or the latest render's if it isn't ready, None before the first)
+    def wait_for(self, index, timeout=WAIT_SECONDS):
+        with self._cond:
+            self._cond.wait_for(lambda: index in self.frames, timeout=timeout)
+            frame = self.frames.get(index)
+            if frame is None:
+                return None, self.last_seconds
+            self.frames.move_to_end(index)
+            return frame, self.seconds[index]
+
+    def _expire(self):
+        cutoff = time.monotonic() - LEASE_SECONDS
+        for sid, (_, seen) in list(self.subscribers.items()):
+            if seen < cutoff:
+                del self.subscribers[sid]
+
+    # Next missing frame closest to some subscriber's cursor, or None
+    def _next_wanted(self):
+        for ahead in range(LOOKAHEAD):
+            for cursor, _ in self.subscribers.values():
+                idx = self.index(cursor + ahead)
+                if idx not in self.frames:
+                    return idx
+        return None
+
+    def _produce(self):
+        while True:
+            with self._cond:
+                self._expire()
+                if not self.subscribers:
+                    break
+                idx = self._next_wanted()
+                if idx is None:
+                    self._cond.wait(timeout=LEASE_SECONDS / 2)
+                    continue
+            t0 = time.perf_counter()
+            frame = self.render(idx)
+            seconds = time.perf_counter() - t0
+            with self._cond:
+                self.rendered += 1
+                self.frames[idx] = frame
+                self.seconds[idx] = self.last_seconds = seconds
+                while len(self.frames) > MAX_FRAMES:
+                    self.seconds.pop(self.frames.popitem(last=False)[0], None)
+                self._cond.notify_all()
+        if self._on_exit is not None:
+            self._on_exit(self)
+
+
+class FrameBroadcaster:
+    """Process-wide registry of ``FrameStream`` objects keyed by parameters."""
+
+    def __init__(self):
+        self._streams = {}
+        self._sessions = {}  # (session id, animation name) -> stream key
+        self._lock = threading.Lock()
+
+    # (frame, render seconds) for ``tick`` of the stream for ``key``; the frame is
+    # None if the producer can't deliver within ``timeout``. Callers skip the tick
+    # rather than render a duplicate, so slow frames never multiply CPU by the
+    # viewer count.
+    def frame(self, session_id, name, key, render, tick, period=None, timeout=WAIT_SECONDS):
+        with self._lock:
+            old = self._sessions.get((session_id, name))
+            if old is not None and old != key and old in self._streams:
+                self._streams[old].unsubscribe(session_id)
+            self._sessions[(session_id, name)] = key
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = self._streams[key] = FrameStream(key, render, period, on_exit=self._drop)
+            stream.subscribe(session_id, tick)
+        return stream.wait_for(stream.index(tick), timeout=timeout)
+
+    def release(self, session_id, name):
+        with self._lock:
+            key = self._sessions.pop((session_id, name), None)
+            stream = self._streams.get(key)
+        if stream is not None:
+            stream.unsubscribe(session_id)
+
+    def _drop(self, stream):
+        with self._lock:
+            with stream._cond:
+                if stream.subscribers:
+                    # a new subscriber raced in; keep producing
+                    stream._thread = threading.Thread(target=stream._produce, name=f"optivion-stream-{stream.key}", daemon=True)
+                    stream._thread.start()
+                    return
+            if self._streams.get(stream.key) is stream:
+                del self._streams[stream.key]
+
+    # {key: (subscribers, frames rendered)} for monitoring
+    def stats(self):
+        with self._lock:
+            return {key: (len(s.subscribers), s.rendered) for key, s in self._streams.items()}
+
+
+BROADCASTER = FrameBroadcaster()
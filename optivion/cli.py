@@ -0,0 +1,245 @@
+"""Headless batch renderer for parameter sweeps.
+
+    python -m optivion render interference --wavelengths 1:10:0.5 --phases 0:360:15 --resolutions 128,256 --out frames/
+    python -m optivion render signal --frequencies 1,2,5 --noise 0:0.5:0.05 --out frames/
+    python -m optivion render model --datasets Moons,Circles --models SVM,KNN --jitter 0,0.03 --out frames/
+    python -m optivion atlas --size 128
+    python -m optivion loadtest --sessions 8 --duration 30
+    python -m optivion store --clear
+
+Every grid point becomes one file (PNG, or ``.npy`` with ``--raw``), written
+atomically by a pool of worker processes. Files that already exist are
+skipped, so an interrupted sweep resumes where it stopped.
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+
+# Helper: parse "a:b:step" (inclusive) or "a,b,c" into a list of floats
+def parse_grid(spec):
+    if ":" in spec:
+        start, stop, step = (float(v) for v in spec.split(":"))
+        if step <= 0:
+            raise argparse.ArgumentTypeError(f"step must be positive: {spec!r}")
+        n = int(np.floor((stop - start) / step + 1e-9)) + 1
+        return [round(start + i * step, 10) for i in range(n)]
+    return [float(v) for v in spec.split(",") if v.strip()]
+
+
+def parse_ints(spec):
+    return [int(v) for v in parse_grid(spec)]
+
+
+def parse_names(spec):
+    return [v.strip() for v in spec.split(",") if v.strip()]
+
+
+# argparse type: comma list checked against ``optivion.models.<attr>`` (imported lazily)
+def model_choices(attr):
+    def parse(spec):
+        from optivion import models
+
+        choices = getattr(models, attr)
+        names = parse_names(spec)
+        unknown = [n for n in names if n not in choices]
+        if unknown:
+            raise argparse.ArgumentTypeError(f"unknown {attr.lower()}: {', '.join(unknown)} (choose from {', '.join(choices)})")
+        return names
+    return parse
+
+
+# Helper: decimals needed to tell every grid value apart (at least ``minimum``)
+def decimals(values, minimum):
+    return max([minimum] + [next(d for d in range(11) if round(v, d) == v) for v in values])
+
+
+def unique(values):
+    return list(dict.fromkeys(values))
+
+
+# Build (filename stem, params) for every point of the requested grid
+def build_tasks(args):
+    # stem precision follows the grid step, so fine grids never share a filename
+    # (the minimums keep the original names, so existing coarse sweeps still resume)
+    if args.kind == "interference":
+        dw, dp = decimals(args.wavelengths, 2), decimals(args.phases, 2)
+        for wl, ph, n in itertools.product(unique(args.wavelengths), unique(args.phases), unique(args.resolutions)):
+            yield (f"interference_wl{wl:0{4 + dw}.{dw}f}_ph{ph:0{4 + dp}.{dp}f}_n{n}",
+                   dict(wavelength=wl, phase_diff_deg=ph, size=n))
+    elif args.kind == "signal":
+        df, dn = decimals(args.frequencies, 2), decimals(args.noise, 3)
+        for f, nz in itertools.product(unique(args.frequencies), unique(args.noise)):
+            yield f"signal_f{f:0{4 + df}.{df}f}_noise{nz:.{dn}f}", dict(freq=f, amp=args.amp, noise=nz, phase=args.phase)
+    else:
+        dj = decimals(args.jitter, 3)
+        for ds, m, j in itertools.product(unique(args.datasets), unique(args.models), unique(args.jitter)):
+            slug = m.lower().replace(" ", "_")
+            yield f"model_{ds.lower()}_{slug}_j{j:.{dj}f}", dict(dataset=ds, model=m, jitter=j)
+
+
+# Worker: render one grid point and write it to ``path`` atomically
+def render_task(kind, params, path, raw, seed):
+    from optivion import plots
+
+    rng = np.random.default_rng(seed)
+    if kind == "interference":
+        from optivion.fields import generate_2d_field
+        if raw:
+            out = generate_2d_field(separation=10.0, **params)
+        else:
+            out = plots.render_2d_frame(params["wavelength"], params["phase_diff_deg"], params["size"])
+    elif kind == "signal":
+        if raw:
+            out = np.stack(plots.signal_samples(rng=rng, **params))
+        else:
+            out = plots.render_signal_frame(rng=rng, **params)
+    else:
+        from optivion import models
+        X, y = models.load_dataset(params["dataset"])
+        xx, yy = models.boundary_grid(X)
+        model = models.make_model(params["model"])
+        Xj, Z = models.decision_surface(model, X, y, xx, yy, jitter=params["jitter"], rng=rng)
+        if raw:
+            out = Z.astype(np.int8)
+        else:
+            out = plots.render_model_frame(xx, yy, Z, Xj, y, f"{params['model']} Decision Boundary")
+
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as fh:
+        if raw:
+            np.save(fh, out)
+        else:
+            from PIL import Image
+            (out if isinstance(out, Image.Image) else Image.fromarray(out)).save(fh, format="PNG")
+    os.replace(tmp, path)
+    return str(path)
+
+
+def cmd_render(args):
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ext = ".npy" if args.raw else ".png"
+    tasks = [(stem, params) for stem, params in build_tasks(args)]
+    todo = [(i, out_dir / (stem + ext), params) for i, (stem, params) in enumerate(tasks)
+            if not (out_dir / (stem + ext)).exists()]
+    skipped = len(tasks) - len(todo)
+    print(f"{len(tasks)} frames in grid, {skipped} already on disk, {len(todo)} to render "
+          f"with {args.workers} workers", file=sys.stderr)
+    if not todo:
+        return 0
+
+    failures = 0
+    done = 0
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(render_task, args.kind, params, str(path), args.raw, args.seed + i): path
+                   for i, path, params in todo}
+        for fut in as_completed(futures):
+            done += 1
+            try:
+                fut.result()
+            except Exception as e:
+                failures += 1
+                print(f"failed: {futures[fut].name}: {e}", file=sys.stderr)
+            if not args.quiet and (done % args.progress_every == 0 or done == len(todo)):
+                rate = done / max(time.perf_counter() - t0, 1e-9)
+                eta = (len(todo) - done) / rate
+                print(f"[{done}/{len(todo)}] {rate:.1f} frames/s, eta {eta:.0f}s", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def cmd_atlas(args):
+    from optivion.atlas import DEFAULT_DIR, FieldAtlas
+
+    atlas = FieldAtlas(args.size, directory=args.dir or DEFAULT_DIR)
+    print(f"atlas {args.size}x{args.size} in {atlas.directory}: {atlas.progress * 100:.1f}% built", file=sys.stderr)
+    atlas.build(on_progress=lambda p: print(f"{p * 100:.1f}%", file=sys.stderr))
+    return 0
+
+
+def cmd_loadtest(args):
+    from optivion.loadtest import cmd_loadtest as run
+
+    return run(args)
+
+
+def cmd_store(args):
+    from optivion.store import DEFAULT_DIR, MAX_BYTES, ArtifactStore
+
+    store = ArtifactStore(args.dir or DEFAULT_DIR, max_bytes=MAX_BYTES or 1)
+    if args.clear:
+        store.clear()
+    stats = store.stats()
+    print(f"{stats['directory']}: {stats['entries']} artifacts, "
+          f"{stats['bytes'] / 2**20:.1f} / {MAX_BYTES / 2**20:.0f} MiB")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="optivion", description="Optivion headless tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    render = sub.add_parser("render", help="render a parameter sweep to disk")
+    kinds = render.add_subparsers(dest="kind", required=True)
+
+    def common(p):
+        p.add_argument("--out", required=True, help="output directory")
+        p.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        p.add_argument("--raw", action="store_true", help="save arrays as .npy instead of rendered PNGs")
+        p.add_argument("--seed", type=int, default=0, help="base seed for noise/jitter (offset per frame)")
+        p.add_argument("--progress-every", type=int, default=10)
+        p.add_argument("--quiet", action="store_true")
+
+    p = kinds.add_parser("interference", help="2D interference frames")
+    p.add_argument("--wavelengths", type=parse_grid, default=[5.0])
+    p.add_argument("--phases", type=parse_grid, default=[90.0])
+    p.add_argument("--resolutions", type=parse_ints, default=[256])
+    common(p)
+
+    p = kinds.add_parser("signal", help="analog signal frames")
+    p.add_argument("--frequencies", type=parse_grid, default=[2.0])
+    p.add_argument("--noise", type=parse_grid, default=[0.05])
+    p.add_argument("--amp", type=float, default=1.0)
+    p.add_argument("--phase", type=float, default=0.0)
+    common(p)
+
+    p = kinds.add_parser("model", help="decision boundary frames")
+    p.add_argument("--datasets", type=model_choices("DATASETS"), default=["Moons"])
+    p.add_argument("--models", type=model_choices("MODELS"), default=["SVM"])
+    p.add_argument("--jitter", type=parse_grid, default=[0.0])
+    common(p)
+
+    render.set_defaults(func=cmd_render)
+
+    atlas = sub.add_parser("atlas", help="precompute the Interference (wavelength, phase) atlas")
+    atlas.add_argument("--size", type=int, default=256, help="2D resolution to build")
+    atlas.add_argument("--dir", default=None, help="atlas directory (default $OPTIVION_ATLAS_DIR or ~/.cache/optivion/atlas)")
+    atlas.set_defaults(func=cmd_atlas)
+
+    load = sub.add_parser("loadtest", help="drive N simulated sessions against app.py and report latency/fps/cpu/memory")
+    load.add_argument("--sessions", type=int, default=4)
+    load.add_argument("--duration", type=float, default=30.0, help="seconds")
+    load.add_argument("--pages", default=None, help="comma-separated page names (default: all)")
+    load.add_argument("--ticks", type=int, default=10, help="frames per Play before Stop")
+    load.add_argument("--seed", type=int, default=0)
+    load.add_argument("--json", action="store_true", help="print the report as JSON")
+    load.set_defaults(func=cmd_loadtest)
+
+    store = sub.add_parser("store", help="show (or clear) the shared on-disk artifact store")
+    store.add_argument("--dir", default=None, help="store directory (default $OPTIVION_STORE_DIR or ~/.cache/optivion/store)")
+    store.add_argument("--clear", action="store_true", help="delete every stored artifact")
+    store.set_defaults(func=cmd_store)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
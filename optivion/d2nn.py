@@ -0,0 +1,179 @@
+"""Diffractive optical neural network (D2NN) simulator.
+
+A stack of trainable phase masks with angular-spectrum propagation between
+them; each class scores the intensity on its own detector region. Masks are
+trained with Adam on the analytic adjoint gradient, and prediction folds the
+trained (linear) stack into one pupil-to-detector matrix. Follows the sklearn
+estimator interface, so the Model Explorer treats it like any other model.
+"""
+import time
+
+import numpy as np
+
+from optivion.diffraction import transfer_function
+
+
+class DiffractiveNetwork:
+    """Phase-mask classifier for low-dimensional points."""
+
+    def __init__(self, layers=3, size=32, wavelength=1.0, spacing=12.0, epochs=40, batch_size=64,
+                 learning_rate=0.1, temperature=10.0, memory_mb=64, random_state=0, warm_start=False):
+        self.layers = layers
+        self.size = size
+        self.wavelength = wavelength
+        self.spacing = spacing
+        self.epochs = epochs
+        self.batch_size = batch_size
+        self.learning_rate = learning_rate
+        self.temperature = temperature
+        self.memory_mb = memory_mb
+        self.random_state = random_state
+        self.warm_start = warm_start
+
+    # Largest batch whose ``buffers`` (batch, N, N) complex64 arrays fit in ``memory_mb``
+    def _chunk(self, buffers):
+        per_sample = buffers * self.size * self.size * np.dtype(np.complex64).itemsize
+        return max(1, int(self.memory_mb * 2**20 // per_sample))
+
+    def _setup(self, n_features, n_classes):
+        rng = np.random.default_rng(self.random_state)
+        n = self.size
+        yy, xx = np.mgrid[-1:1:n * 1j, -1:1:n * 1j].astype(np.float32)
+        self.pupil_ = (xx ** 2 + yy ** 2 <= 0.8 ** 2).astype(np.complex64)
+        # fixed encoder: one smooth phase pattern per feature (tilt + low-order ripple)
+        a, b, c, d, e = rng.normal(size=(5, n_features, 1, 1)).astype(np.float32)
+        self.encoder_ = (np.pi / 2) * (a * xx + b * yy + c * np.cos(np.pi * (d * xx + e * yy)))
+        self.phases_ = rng.normal(0, 0.1, size=(self.layers, n, n)).astype(np.float32)
+        self.H_ = transfer_function(n, 1.0, float(self.wavelength), float(self.spacing), "Angular spectrum")
+        # detector squares evenly spaced on a ring around the optical axis
+        angles = 2 * np.pi * np.arange(n_classes) / n_classes
+        self.detectors_ = np.stack([
+            ((np.abs(xx - 0.4 * np.cos(t)) <= 0.15) & (np.abs(yy - 0.4 * np.sin(t)) <= 0.15))
+            for t in angles
+        ]).astype(np.float32)
+
+    def _propagate(self, u):
+        return np.fft.ifft2(np.fft.fft2(u) * self.H_)
+
+    # Adjoint of ``_propagate`` (ifft2 ∘ H ∘ fft2 is its own adjoint with conj(H))
+    def _propagate_adjoint(self, u):
+        return np.fft.ifft2(np.fft.fft2(u) * np.conj(self.H_))
+
+    # exp(i·phase) without the complex128 round trip of np.exp(1j * ...)
+    @staticmethod
+    def _cis(phase):
+        out = np.empty(phase.shape, dtype=np.complex64)
+        np.cos(phase, out=out.real)
+        np.sin(phase, out=out.imag)
+        return out
+
+    def _encode(self, X):
+        return self.pupil_ * self._cis(np.tensordot(X, self.encoder_, axes=1))
+
+    # Trained stack folded to (pupil pixels, detector pixels): out = u0[pupil] @ matrix
+    def _readout(self):
+        if self._readout_ is None:
+            n = self.size
+            pupil = np.flatnonzero(self.pupil_.real)
+            pixels = np.flatnonzero(self.detectors_.sum(axis=0))
+            delta = np.zeros((len(pixels), n * n), dtype=np.complex64)
+            delta[np.arange(len(pixels)), pixels] = 1.0
+            delta = self._propagate_adjoint(delta.reshape(-1, n, n))
+            for layer in range(self.layers - 1, -1, -1):
+                delta *= np.conj(self._cis(self.phases_[layer]))
+                delta = self._propagate_adjoint(delta)
+            matrix = np.ascontiguousarray(np.conj(delta.reshape(len(pixels), -1)[:, pupil]).T)
+            detectors = self.detectors_.reshape(len(self.classes_), -1)[:, pixels]
+            self._readout_ = (self.encoder_.reshape(len(self.encoder_), -1)[:, pupil], matrix, detectors)
+        return self._readout_
+
+    # Forward pass over one chunk; returns detector energies (batch, classes)
+    # and, with ``keep``, the post-mask fields and output field for backprop
+    def _forward(self, X, keep=False):
+        masks = self._cis(self.phases_)
+        u = self._encode(X)
+        fields = []
+        for mask in masks:
+            u = self._propagate(u)
+            u *= mask
+            if keep:
+                fields.append(u)
+        out = self._propagate(u)
+        energy = np.einsum("bij,cij->bc", (out.real ** 2 + out.imag ** 2), self.detectors_)
+        return energy, (masks, fields, out)
+
+    # Cross-entropy on softmax(T * normalized energies); returns (loss, gradient wrt phases)
+    def _loss_and_grad(self, X, y):
+        energy, (masks, fields, out) = self._forward(X, keep=True)
+        total = energy.sum(axis=1, keepdims=True) + 1e-12
+        p = energy / total
+        s = self.temperature * p
+        s -= s.max(axis=1, keepdims=True)
+        soft = np.exp(s)
+        soft /= soft.sum(axis=1, keepdims=True)
+        loss = -np.log(soft[np.arange(len(y)), y] + 1e-12).mean()
+
+        g = soft
+        g[np.arange(len(y)), y] -= 1.0
+        g /= len(y)
+        d_energy = self.temperature / total * (g - (g * p).sum(axis=1, keepdims=True))
+        # dL/d(conj field) at the output plane, then back through every layer
+        delta = np.einsum("bc,cij->bij", d_energy, self.detectors_).astype(np.float32) * out
+        grads = np.empty_like(self.phases_)
+        for layer in range(self.layers - 1, -1, -1):
+            delta = self._propagate_adjoint(delta)
+            grads[layer] = 2 * np.imag(delta * np.conj(fields[layer])).sum(axis=0)
+            delta *= np.conj(masks[layer])
+        return float(loss), grads
+
+    def fit(self, X, y):
+        X = np.asarray(X, dtype=np.float32)
+        classes, y_idx = np.unique(y, return_inverse=True)
+        # warm start: keep training the current masks instead of starting from random ones
+        if not (self.warm_start and hasattr(self, "phases_") and np.array_equal(classes, self.classes_)):
+            self.classes_ = classes
+            self._setup(X.shape[1], len(classes))
+            self.loss_history_ = []
+        self._readout_ = None
+        rng = np.random.default_rng(self.random_state)
+        # forward + backward keeps layers + 3 arrays per sample alive
+        batch = min(self.batch_size, self._chunk(self.layers + 3))
+        m = np.zeros_like(self.phases_)
+        v = np.zeros_like(self.phases_)
+        beta1, beta2, step = 0.9, 0.999, 0
+        t0 = time.perf_counter()
+        for _ in range(self.epochs):
+            order = rng.permutation(len(X))
+            losses = []
+            for start in range(0, len(X), batch):
+                idx = order[start:start + batch]
+                loss, grad = self._loss_and_grad(X[idx], y_idx[idx])
+                step += 1
+                m = beta1 * m + (1 - beta1) * grad
+                v = beta2 * v + (1 - beta2) * grad ** 2
+                m_hat = m / (1 - beta1 ** step)
+                v_hat = v / (1 - beta2 ** step)
+                self.phases_ -= self.learning_rate * m_hat / (np.sqrt(v_hat) + 1e-8)
+                self._readout_ = None
+                losses.append(loss)
+            self.loss_history_.append(float(np.mean(losses)))
+        self.fit_time_ = time.perf_counter() - t0
+        return self
+
+    # Normalized detector energies per class, computed in memory-bounded chunks
+    def predict_proba(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        encoder, matrix, detectors = self._readout()
+        chunk = self._chunk(2)
+        out = np.empty((len(X), len(self.classes_)), dtype=np.float32)
+        for start in range(0, len(X), chunk):
+            field = self._cis(X[start:start + chunk] @ encoder) @ matrix
+            energy = (field.real ** 2 + field.imag ** 2) @ detectors.T
+            out[start:start + chunk] = energy / (energy.sum(axis=1, keepdims=True) + 1e-12)
+        return out
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+    def score(self, X, y):
+        return float(np.mean(self.predict(X) == np.asarray(y)))
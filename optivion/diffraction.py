@@ -0,0 +1,149 @@
+"""FFT-based scalar diffraction.
+
+Propagates a complex aperture / phase mask to an observation plane in
+O(N² log N) per plane:
+
+- ``Angular spectrum``: exact scalar propagation, H = exp(i k z sqrt(1 - (λfx)² - (λfy)²)),
+  evanescent components dropped.
+- ``Fresnel``: paraxial transfer function, H = exp(i k z) exp(-i π λ z (fx² + fy²)).
+- ``Fraunhofer``: far field on the same fixed window as the aperture; the
+  point x samples the aperture spectrum at x / (λ z), so the pattern grows
+  with wavelength and distance (valid once z ≫ a² / λ). The scaled spectrum
+  is a chirp-z transform per axis, i.e. FFT convolutions, not a dense DFT.
+
+The near-field methods zero-pad the aperture to twice its size so the
+periodic FFT doesn't wrap light around the edges. Their transfer functions
+are H = exp(i kz z) with the per-method base phase kz cached, so a distance
+sweep only recomputes the exponential; just the last few H are kept. Grids
+are ``np.linspace(-extent/2, extent/2, size)``, so dx = extent / (size - 1).
+Units are the same arbitrary units as the Interference sliders.
+"""
+import io
+from functools import lru_cache
+
+import numpy as np
+
+APERTURES = ["Double slit", "Grating", "Circular", "Custom mask"]
+METHODS = ["Angular spectrum", "Fresnel", "Fraunhofer"]
+
+
+# Complex aperture transmission on a ``size`` x ``size`` grid of width ``extent``.
+# A custom ``mask`` in [0, 1] is an amplitude mask, or with ``phase_only`` a
+# pure phase mask exp(2πi·mask).
+def make_aperture(kind, size=256, extent=80.0, slit_width=2.0, slit_separation=8.0,
+                  slit_height=30.0, n_slits=9, radius=6.0, mask=None, phase_only=False):
+    coords = np.linspace(-extent / 2, extent / 2, size, dtype=np.float32)
+    if kind == "Custom mask":
+        if mask is None:
+            raise ValueError("Custom mask aperture needs a mask array")
+        if phase_only:
+            return np.exp(2j * np.pi * mask).astype(np.complex64)
+        return mask.astype(np.complex64)
+    if kind == "Circular":
+        xx, yy = np.meshgrid(coords, coords)
+        return (xx ** 2 + yy ** 2 <= radius ** 2).astype(np.complex64)
+    n = 2 if kind == "Double slit" else int(n_slits)
+    centres = (np.arange(n) - (n - 1) / 2) * slit_separation
+    open_x = np.zeros(size, dtype=bool)
+    for c in centres:
+        open_x |= np.abs(coords - c) <= slit_width / 2
+    open_y = np.abs(coords) <= slit_height / 2
+    return (open_y[:, None] & open_x[None, :]).astype(np.complex64)
+
+
+# Amplitude mask from an uploaded image (dark = opaque, light = open)
+def mask_from_image(data, size):
+    from PIL import Image
+
+    im = Image.open(io.BytesIO(data)).convert("L").resize((size, size), Image.BILINEAR)
+    return np.asarray(im, dtype=np.float32) / 255.0
+
+
+# Base phase per unit distance (H = exp(i kz z)) and the propagating-frequency mask (or None)
+@lru_cache(maxsize=4)
+def _kz(n, dx, wavelength, method):
+    fx = np.fft.fftfreq(n, d=dx).astype(np.float32)
+    fx2 = fx[None, :] ** 2 + fx[:, None] ** 2
+    k = np.float32(2 * np.pi / wavelength)
+    if method == "Angular spectrum":
+        arg = 1.0 - np.float32(wavelength ** 2) * fx2
+        return k * np.sqrt(np.maximum(arg, 0.0)), arg > 0
+    if method == "Fresnel":
+        return k - np.float32(np.pi * wavelength) * fx2, None
+    raise ValueError(f"no transfer function for {method!r}")
+
+
+# 8 MiB per entry at the padded 1024² of a 512 grid, so only a few are kept
+@lru_cache(maxsize=4)
+def transfer_function(n, dx, wavelength, distance, method):
+    kz, propagating = _kz(n, dx, wavelength, method)
+    H = np.exp(1j * (np.float32(distance) * kz))
+    if propagating is not None:
+        H[~propagating] = 0  # evanescent components dropped
+    H.setflags(write=False)
+    return H
+
+
+# Helper: sum_m u[m] exp(-2πi α (j - c)(m - c)) along ``axis`` for j, m in range(n),
+# c = (n - 1) / 2, as one FFT convolution (Bluestein: (j-c)(m-c) = ((j-c)² + (m-c)² - (j-m)²) / 2)
+def _chirp_dft(u, alpha, axis):
+    n = u.shape[axis]
+    size = 1 << (2 * n - 2).bit_length()  # >= 2n - 1, so the circular convolution doesn't wrap
+    shape = [1] * u.ndim
+    shape[axis] = n
+    w = np.exp(-1j * np.pi * alpha * (np.arange(n) - (n - 1) / 2) ** 2).astype(np.complex64).reshape(shape)
+    d = np.arange(size)
+    d = np.where(d < n, d, d - size)  # lags -(n-1)..(n-1); the rest are never read
+    h = np.where(np.abs(d) < n, np.exp(1j * np.pi * alpha * d.astype(np.float64) ** 2), 0)
+    shape[axis] = size
+    H = np.fft.fft(h).astype(np.complex64).reshape(shape)
+    out = np.fft.ifft(np.fft.fft(u * w, n=size, axis=axis) * H, axis=axis)
+    return np.take(out, np.arange(n), axis=axis) * w
+
+
+# Far field of ``u0`` on its own window: the aperture spectrum at x / (λz) (a chirp-z
+# transform per axis), times the exp(ikz) exp(iπ(x² + y²)/(λz)) / (iλz) prefactor
+def fraunhofer(u0, wavelength, distance, dx):
+    n = u0.shape[0]
+    lz = wavelength * distance
+    alpha = dx * dx / lz
+    out = _chirp_dft(_chirp_dft(u0.astype(np.complex64), alpha, 1), alpha, 0)
+    chirp = np.exp((1j * np.pi / lz) * ((np.arange(n) - (n - 1) / 2) * dx) ** 2)
+    scale = np.exp(2j * np.pi * distance / wavelength) / (1j * lz) * dx * dx
+    out *= (scale * np.outer(chirp, chirp)).astype(np.complex64)
+    return out
+
+
+# Field at ``distance`` from aperture ``u0`` sampled at ``dx``
+def propagate(u0, wavelength, distance, dx, method="Angular spectrum"):
+    n = u0.shape[0]
+    if distance == 0:
+        return u0
+    if method == "Fraunhofer":
+        return fraunhofer(u0, wavelength, distance, dx)
+    pad = n // 2
+    padded = np.pad(u0, pad)
+    H = transfer_function(padded.shape[0], float(dx), float(wavelength), float(distance), method)
+    out = np.fft.ifft2(np.fft.fft2(padded) * H)
+    return out[pad:pad + n, pad:pad + n]
+
+
+# Helper: |u|² as uint8, optionally log-compressed to show faint orders
+def intensity_image(u, log=True, dynamic_range=1e3):
+    intensity = np.abs(u) ** 2
+    peak = float(intensity.max()) or 1.0
+    intensity /= peak
+    if log:
+        intensity = np.log10(1.0 + dynamic_range * intensity) / np.log10(1.0 + dynamic_range)
+    return (np.clip(intensity, 0, 1) * 255).astype(np.uint8)
+
+
+# One-call helper used by the viewer: aperture -> observation-plane image
+def diffraction_image(aperture, wavelength, distance, extent=80.0, method="Angular spectrum", log=True):
+    dx = extent / (aperture.shape[0] - 1)  # make_aperture's linspace spacing
+    return intensity_image(propagate(aperture, wavelength, distance, dx, method), log=log)
+
+
+# Play / export sweep: frame ``i`` propagates to ``(i % frames + 1) / frames`` of ``distance``
+def sweep_distance(i, distance, frames=60):
+    return distance * ((i % frames) + 1) / frames
@@ -0,0 +1,39 @@
+"""Frame capture and export helpers."""
+import io
+import zipfile
+
+from PIL import Image
+
+from optivion.transport import to_array
+
+
+# Helper: capture N frames from a function that returns an image array
+def capture_frames_from_func(frame_func, n_frames=10):
+    frames = []
+    for i in range(n_frames):
+        frames.append(frame_func(i))
+    return frames
+
+
+# Helper: create a downloadable zip bytes object from list of numpy arrays (PNG)
+def create_frames_zip_bytes(frames, prefix="frame"):
+    bio = io.BytesIO()
+    with zipfile.ZipFile(bio, mode='w') as zf:
+        for idx, arr in enumerate(frames):
+            # arr expected uint8 2D or 3D
+            im = Image.fromarray(arr)
+            buf = io.BytesIO()
+            im.save(buf, format='PNG')
+            buf.seek(0)
+            zf.writestr(f"{prefix}_{idx:03d}.png", buf.read())
+    bio.seek(0)
+    return bio.read()
+
+
+# Helper: encode frames (arrays or encoded bytes) as an animated GIF
+def create_gif_bytes(frames, duration=80):
+    pil_frames = [Image.fromarray(to_array(f)).convert('P') for f in frames]
+    bio = io.BytesIO()
+    pil_frames[0].save(bio, format='GIF', save_all=True, append_images=pil_frames[1:], duration=duration, loop=0)
+    bio.seek(0)
+    return bio.read()
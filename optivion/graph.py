@@ -0,0 +1,77 @@
+"""Dependency-tracked recomputation across Streamlit reruns.
+
+Every widget interaction reruns the whole script. A ``ComputeGraph``
+remembers each derived artifact (dataset, fitted model, field, rendered
+frame) together with the ``st.session_state`` keys and upstream nodes it
+was computed from, and only recomputes it when one of those changed —
+so toggling Loop or moving a Speed slider costs a dictionary lookup.
+
+    graph = ComputeGraph("model_explorer")
+
+    @graph.node("dataset", inputs=["me_dataset"])
+    def _():
+        return load_dataset(st.session_state.me_dataset)
+
+    @graph.node("model", inputs=["me_model"], deps=["dataset"])
+    def _(dataset):
+        ...
+
+    X, y = graph.get("dataset")
+
+Nodes are re-registered on every run (so closures see current locals), but
+anything a node reads must be declared in ``inputs``/``deps``; undeclared
+values will not trigger recomputation. Inputs should be plain widget
+values (compared with ``==``).
+"""
+import streamlit as st
+
+
+class ComputeGraph:
+    """Per-session cache of derived values keyed by their declared inputs."""
+
+    def __init__(self, scope, state=None):
+        self.state = st.session_state if state is None else state
+        self._store_key = f"_graph_{scope}"
+        self._nodes = {}
+        self.recomputed = []
+
+    @property
+    def _store(self):
+        if self._store_key not in self.state:
+            self.state[self._store_key] = {}
+        return self.state[self._store_key]
+
+    # Decorator: register ``func(*dep_values)`` as node ``name``
+    def node(self, name, inputs=(), deps=()):
+        def register(func):
+            self._nodes[name] = (tuple(inputs), tuple(deps), func)
+            return func
+        return register
+
+    # Value of ``name``, recomputing it (and stale upstream nodes) if needed
+    def get(self, name):
+        value, _ = self._resolve(name)
+        return value
+
+    def _resolve(self, name):
+        inputs, deps, func = self._nodes[name]
+        dep_results = [self._resolve(d) for d in deps]
+        signature = (
+            tuple(self.state.get(k) for k in inputs),
+            tuple(version for _, version in dep_results),
+        )
+        entry = self._store.get(name)
+        if entry is not None and entry[0] == signature:
+            return entry[1], entry[2]
+        value = func(*(v for v, _ in dep_results))
+        version = entry[2] + 1 if entry is not None else 0
+        self._store[name] = (signature, value, version)
+        self.recomputed.append(name)
+        return value, version
+
+    # Drop cached values (all, or just ``names``)
+    def invalidate(self, *names):
+        if not names:
+            self._store.clear()
+        for name in names:
+            self._store.pop(name, None)
@@ -0,0 +1,214 @@
+"""Local multi-session load harness.
+
+    python -m optivion loadtest --sessions 8 --duration 30
+
+Drives N simulated sessions of ``app.py`` concurrently, each on its own
+thread through Streamlit's ``AppTest`` — the same shape as a real server:
+one process, one script thread per session, shared caches, broadcaster
+and frame-rate cap. Sessions cycle through the pages moving sliders,
+playing animations and exporting frames. Fragment timers don't fire
+under AppTest, so while an animation plays each rerun stands in for one
+scheduler tick.
+
+Reports rerun latency percentiles per action, frames delivered per
+second, and process CPU / RSS growth per session. No network is used.
+"""
+import json
+import random
+import resource
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+# Per page: sliders (key -> (lo, hi, step)), selectboxes (key -> options),
+# animations (play button, stop button, scheduler name) and exports
+# (number input key, frames, button)
+PAGES = {
+    "Home": {},
+    "Interference": {
+        "sliders": {"phase_diff": (0, 360, 1), "wavelength": (1.0, 10.0, 0.1)},
+        "plays": [("play1d", "stop1d", "interf_1d"), ("play2d_view", "stop2d_view", "interf_2d")],
+        "exports": [("interf_export_n", 3, "interf_capture")],
+    },
+    "Analog Signal Simulation": {
+        "sliders": {"freq": (1.0, 10.0, 0.1), "amp": (0.5, 5.0, 0.1), "noise": (0.0, 0.5, 0.01)},
+        "plays": [("play_signal", "stop_signal", "sim")],
+        "exports": [("sim_export_n", 3, "sim_capture")],
+    },
+    "Model Explorer": {
+        "selects": {"me_dataset": ["Moons", "Circles", "Classification"], "me_model": ["SVM", "Logistic Regression", "KNN", "Diffractive network"]},
+        "plays": [("play_model", "stop_model", "model")],
+    },
+}
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _random_value(lo, hi, step, rng):
+    n = int(round((hi - lo) / step))
+    v = lo + step * rng.randint(0, n)
+    return int(v) if isinstance(lo, int) and isinstance(step, int) else round(v, 6)
+
+
+class SimulatedSession(threading.Thread):
+    """One viewer clicking through the app until ``deadline``."""
+
+    def __init__(self, index, pages, deadline, ticks, seed, timeout):
+        super().__init__(name=f"loadtest-session-{index}", daemon=True)
+        self.index = index
+        self.pages = pages
+        self.deadline = deadline
+        self.ticks = ticks
+        self.rng = random.Random(seed + index)
+        self.timeout = timeout
+        self.latencies = defaultdict(list)
+        self.frames = 0
+        self.errors = []
+
+    def _step(self, action, widget_call):
+        t0 = time.perf_counter()
+        at = widget_call()
+        self.latencies[action].append(time.perf_counter() - t0)
+        if at.exception:
+            self.errors.append(f"{action}: {at.exception[0].value}")
+        return at
+
+    def _tick_count(self, at, name):
+        try:
+            return int(at.session_state[f"_anim_tick_{name}"])
+        except KeyError:
+            return 0
+
+    def run(self):
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_file(str(APP_PATH), default_timeout=self.timeout)
+        self._step("load", at.run)
+        i = self.index
+        while time.monotonic() < self.deadline:
+            page = self.pages[i % len(self.pages)]
+            i += 1
+            spec = PAGES[page]
+            self._step("navigate", lambda: at.radio(key="nav").set_value(page).run())
+
+            for key, (lo, hi, step) in spec.get("sliders", {}).items():
+                value = _random_value(lo, hi, step, self.rng)
+                self._step("slider", lambda: at.slider(key=key).set_value(value).run())
+            for key, options in spec.get("selects", {}).items():
+                value = self.rng.choice(options)
+                self._step("select", lambda: at.selectbox(key=key).set_value(value).run())
+
+            for play, stop, name in spec.get("plays", []):
+                self._step("play", lambda: at.button(key=play).click().run())
+                for _ in range(self.ticks - 1):
+                    if time.monotonic() >= self.deadline:
+                        break
+                    self._step("tick", at.run)
+                self.frames += self._tick_count(at, name)
+                self._step("stop", lambda: at.button(key=stop).click().run())
+
+            for n_key, n, button in spec.get("exports", []):
+                at.number_input(key=n_key).set_value(n)
+                self._step("export", lambda: at.button(key=button).click().run())
+
+            if not spec:
+                self._step("rerun", at.run)
+
+
+def _percentiles(values):
+    arr = np.asarray(values) * 1000.0
+    return {
+        "n": int(arr.size),
+        "p50_ms": float(np.percentile(arr, 50)),
+        "p90_ms": float(np.percentile(arr, 90)),
+        "p99_ms": float(np.percentile(arr, 99)),
+        "max_ms": float(arr.max()),
+    }
+
+
+# Run ``sessions`` concurrent sessions for ``duration`` seconds; returns a report dict
+def run_load(sessions=4, duration=30.0, pages=None, ticks=10, seed=0, timeout=120):
+    from streamlit import config, logger
+
+    # AppTest sessions log "missing ScriptRunContext" and session-state warnings
+    # (with stack traces) on every streamlit.* module logger; set_log_level covers
+    # all of them, and the config option keeps streamlit's lazy config parse from
+    # resetting the level on the first run
+    config.set_option("logger.level", "error")
+    logger.set_log_level("error")
+
+    pages = pages or list(PAGES)
+    rss0 = _rss_bytes()
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    deadline = time.monotonic() + duration
+    workers = [SimulatedSession(i, pages, deadline, ticks, seed, timeout) for i in range(sessions)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    wall = time.perf_counter() - t0
+    cpu = time.process_time() - cpu0
+    rss = _rss_bytes() - rss0
+
+    by_action = defaultdict(list)
+    for w in workers:
+        for action, values in w.latencies.items():
+            by_action[action].extend(values)
+    all_reruns = [v for values in by_action.values() for v in values]
+    frames = sum(w.frames for w in workers)
+    return {
+        "sessions": sessions,
+        "wall_s": wall,
+        "latency": _percentiles(all_reruns) if all_reruns else {},
+        "latency_by_action": {a: _percentiles(v) for a, v in sorted(by_action.items())},
+        "frames": frames,
+        "frames_per_s": frames / wall,
+        "frames_per_s_per_session": frames / wall / sessions,
+        "cpu_s": cpu,
+        "cpu_cores": cpu / wall,
+        "cpu_s_per_session": cpu / sessions,
+        "rss_growth_mb_per_session": rss / sessions / 2**20,
+        "errors": [e for w in workers for e in w.errors],
+    }
+
+
+def format_report(report):
+    lines = [
+        f"{report['sessions']} sessions, {report['wall_s']:.1f}s wall",
+        f"{'action':<10} {'n':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    rows = list(report["latency_by_action"].items()) + [("ALL", report["latency"])]
+    for action, p in rows:
+        lines.append(f"{action:<10} {p['n']:>6} {p['p50_ms']:>9.1f} {p['p90_ms']:>9.1f} {p['p99_ms']:>9.1f} {p['max_ms']:>9.1f}")
+    lines.append(f"frames delivered: {report['frames']} ({report['frames_per_s']:.1f}/s total, "
+                 f"{report['frames_per_s_per_session']:.2f}/s per session)")
+    lines.append(f"cpu: {report['cpu_s']:.1f}s ({report['cpu_cores']:.2f} cores), "
+                 f"{report['cpu_s_per_session']:.2f}s per session")
+    lines.append(f"rss growth: {report['rss_growth_mb_per_session']:.1f} MiB per session")
+    if report["errors"]:
+        lines.append(f"errors: {len(report['errors'])} (first: {report['errors'][0]})")
+    return "\n".join(lines)
+
+
+def cmd_loadtest(args):
+    pages = [p.strip() for p in args.pages.split(",")] if args.pages else None
+    unknown = [p for p in pages or [] if p not in PAGES]
+    if unknown:
+        print(f"unknown page(s): {', '.join(unknown)}; choose from {', '.join(PAGES)}", file=sys.stderr)
+        return 2
+    report = run_load(args.sessions, args.duration, pages=pages, ticks=args.ticks, seed=args.seed)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 1 if report["errors"] else 0
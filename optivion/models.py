@@ -0,0 +1,92 @@
+"""Datasets and classifiers used by the Model Explorer (sklearn + diffractive network)."""
+import copy
+import time
+
+import numpy as np
+from sklearn.datasets import make_moons, make_circles, make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+from optivion.d2nn import DiffractiveNetwork
+
+DATASETS = ["Moons", "Circles", "Classification"]
+MODELS = ["SVM", "Logistic Regression", "KNN", "Diffractive network"]
+JITTER_EPOCHS = 2  # warm-start epochs per animation frame for the diffractive network
+
+
+# Helper: load one of the toy datasets, standardized
+def load_dataset(name):
+    if name == 'Moons':
+        X, y = make_moons(noise=0.3, random_state=0)
+    elif name == 'Circles':
+        X, y = make_circles(noise=0.2, factor=0.5, random_state=1)
+    else:
+        X, y = make_classification(n_features=2, n_redundant=0, n_informative=2, random_state=22, n_clusters_per_class=1)
+    return StandardScaler().fit_transform(X), y
+
+
+# Helper: unfitted classifier by display name
+def make_model(name):
+    if name == 'SVM':
+        return SVC(kernel="rbf", gamma=0.8, C=1.0)
+    elif name == 'Logistic Regression':
+        return LogisticRegression()
+    elif name == 'Diffractive network':
+        return DiffractiveNetwork()
+    return KNeighborsClassifier(n_neighbors=5)
+
+
+# Helper: estimator for one jittered animation frame. The sklearn models refit from
+# scratch; the diffractive network continues from ``fitted``'s masks for a few epochs
+def jitter_model(name, fitted):
+    if isinstance(fitted, DiffractiveNetwork):
+        model = copy.deepcopy(fitted)
+        model.warm_start, model.epochs = True, JITTER_EPOCHS
+        return model
+    return make_model(name)
+
+
+# Helper: hold-out split used for the accuracy readout
+def split_dataset(X, y):
+    return train_test_split(X, y, test_size=0.3, random_state=42)
+
+
+# Helper: grid covering the data for decision-boundary plots
+def boundary_grid(X, h=0.02):
+    x_min, x_max = X[:, 0].min() - 1, X[:, 0].max() + 1
+    y_min, y_max = X[:, 1].min() - 1, X[:, 1].max() + 1
+    return np.meshgrid(np.arange(x_min, x_max, h), np.arange(y_min, y_max, h))
+
+
+# Helper: refit on jittered points and predict the class over the grid
+def decision_surface(model, X, y, xx, yy, jitter=0.0, rng=np.random):
+    Xj = X + rng.normal(0, jitter, size=X.shape)
+    model.fit(Xj, y)
+    Z = model.predict(np.c_[xx.ravel(), yy.ravel()])
+    return Xj, Z.reshape(xx.shape)
+
+
+# Helper: fit on the train split; returns (model, test accuracy, fit seconds)
+def fit_model(name, X, y):
+    X_train, X_test, y_train, y_test = split_dataset(X, y)
+    model = make_model(name)
+    t0 = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_s = time.perf_counter() - t0
+    return model, model.score(X_test, y_test), fit_s
+
+
+# Helper: prediction samples/sec of a fitted ``model`` on ``points``
+def predict_rate(model, points):
+    t0 = time.perf_counter()
+    model.predict(points)
+    return len(points) / max(time.perf_counter() - t0, 1e-9)
+
+
+# Helper: fit_model plus predict_rate on ``points``; returns (model, accuracy, fit seconds, samples/sec)
+def evaluate_model(name, X, y, points):
+    model, score, fit_s = fit_model(name, X, y)
+    return model, score, fit_s, predict_rate(model, points)
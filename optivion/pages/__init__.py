@@ -0,0 +1 @@
+"""Per-page modules. Each exposes a ``render()`` function called by ``app.py``."""
@@ -0,0 +1,64 @@
+"""Home page — clean and minimal. Deliberately imports nothing heavy."""
+import streamlit as st
+
+from optivion.theme import footer
+
+
+def render():
+    st.markdown(
+        """
+        <div style="font-family: 'Exo 2', sans-serif; padding: 0px 40px 20px 40px;">
+            <h1 style="font-size:56px; font-weight:200; color:#111; letter-spacing:3px; margin-bottom:10px;">Optivion</h1>
+            <p style="font-size:22px; color:#333; letter-spacing:1.5px; margin-bottom:5px;">Analog & Light-Based Computation for AI</p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    # Minimal intro text after subtitle
+    st.markdown("""
+<div style="margin-left:40px; max-width:700px; font-family:'Exo 2', sans-serif;">
+  <p style="font-size:17px; line-height:1.6; color:#222;">
+    Optivion is a visual sandbox for exploring how <b>light, waves, and analog signals</b>
+    can perform computation and inspire new AI systems.
+  </p>
+  <p style="font-size:15px; color:#444;">
+    Use the modules below to interactively explore interference patterns,
+    analog simulations, and machine-learning behavior.
+  </p>
+</div>
+""", unsafe_allow_html=True)
+
+    # HOMEPAGE GLOWING CARD SECTION (Interference / Simulation / Model Explorer)
+    st.markdown("""
+<div style="margin-top:40px; display:flex; gap:24px; max-width:900px; margin-left:40px; font-family:'Exo 2', sans-serif;">
+  
+  <div class="home-card" style="flex:1;">
+    <h3>Interference</h3>
+    <p>
+      Visualize how light waves interfere, combine, and cancel.
+      This forms the physical intuition behind analog computation.
+    </p>
+  </div>
+
+  <div class="home-card" style="flex:1;">
+    <h3>Analog Simulation</h3>
+    <p>
+      Explore continuous signals, noise, and real-time dynamics
+      instead of discrete digital steps.
+    </p>
+  </div>
+
+  <div class="home-card" style="flex:1;">
+    <h3>Model Explorer</h3>
+    <p>
+      Connect physics-inspired intuition with machine learning
+      decision boundaries and behavior.
+    </p>
+  </div>
+
+</div>
+""", unsafe_allow_html=True)
+
+    # Footer Section
+    footer()
@@ -0,0 +1,125 @@
+"""Model Explorer page — sklearn and diffractive-network decision boundaries."""
+import numpy as np
+import streamlit as st
+
+from optivion import plots
+from optivion.graph import ComputeGraph
+from optivion.models import DATASETS, MODELS, boundary_grid, decision_surface, evaluate_model, fit_model, jitter_model, load_dataset, make_model, predict_rate
+from optivion.quality import FULL
+from optivion.scheduler import animate, frame_interval, shared_frame
+from optivion.store import default_store
+from optivion.transport import format_controls, show
+
+
+def render():
+    # Model Explorer — controls left, view right, help inside expander
+    controls_col, view_col = st.columns([1,2])
+
+    with controls_col:
+        with st.expander("Controls", expanded=True):
+            dataset_name = st.selectbox("Select Dataset", DATASETS, key='me_dataset')
+            model_name = st.selectbox("Select Model", MODELS, key='me_model')
+            st.checkbox("Compare all models", value=False, key="me_compare",
+                        help="Fits every model on this dataset and tabulates accuracy and prediction throughput.")
+
+            # animation controls and settings
+            if "playing_model" not in st.session_state:
+                st.session_state.playing_model = False
+            if "speed_model" not in st.session_state:
+                st.session_state.speed_model = 1.0
+            if "loop_model" not in st.session_state:
+                st.session_state.loop_model = False
+
+            model_play_a, model_play_b = st.columns([1,1])
+            with model_play_a:
+                if st.button("Play Model", key="play_model"):
+                    st.session_state.playing_model = True
+            with model_play_b:
+                if st.button("Stop Model", key="stop_model"):
+                    st.session_state.playing_model = False
+
+            st.slider("Speed", 0.25, 4.0, value=st.session_state.speed_model, step=0.25, key="speed_model")
+            st.checkbox("Loop", value=st.session_state.loop_model, key="loop_model")
+
+            encoding = format_controls()
+
+            st.markdown("---")
+            with st.expander("Help / Tips", expanded=False):
+                st.write("Switch datasets and models to compare boundaries. Use Play to observe sensitivity to jitter.")
+
+    with view_col:
+        st.markdown("<p style='font-size:15px; color:#222; margin-bottom:8px;'>This shows how physical intuition from waves translates into machine-learning decision boundaries.</p>", unsafe_allow_html=True)
+        graph = ComputeGraph("model_explorer")
+        store = default_store()
+
+        @graph.node("dataset", inputs=["me_dataset"])
+        def _():
+            return load_dataset(dataset_name)
+
+        @graph.node("grid", deps=["dataset"])
+        def _(dataset):
+            return boundary_grid(dataset[0])
+
+        # only the estimator and its accuracy are stored; throughput depends on the host, so it is
+        # measured here, on the decision-boundary grid (the page's real prediction workload)
+        @graph.node("fitted", inputs=["me_model"], deps=["dataset", "grid"])
+        def _(dataset, grid):
+            model, score = store.fetch(lambda: fit_model(model_name, *dataset)[:2],
+                                       "model_estimator", dataset_name, model_name)
+            return model, score, predict_rate(model, np.c_[grid[0].ravel(), grid[1].ravel()])
+
+        @graph.node("comparison", deps=["dataset", "grid"])
+        def _(dataset, grid):
+            points = np.c_[grid[0].ravel(), grid[1].ravel()]
+            rows = []
+            for name in MODELS:
+                _, score, fit_s, rate = evaluate_model(name, *dataset, points)
+                rows.append({"Model": name, "Accuracy": f"{score*100:.1f}%", "Fit (ms)": round(fit_s * 1000, 1),
+                             "Predict (samples/s)": f"{rate:,.0f}"})
+            return rows
+
+        X, y = graph.get("dataset")
+        model, score, rate = graph.get("fitted")
+        st.markdown(f"<p style='font-size:16px; color:#000;'>Model Accuracy: <strong>{score*100:.2f}%</strong>"
+                    f" &nbsp;·&nbsp; {rate:,.0f} samples/s</p>", unsafe_allow_html=True)
+        if st.session_state.me_compare:
+            st.dataframe(graph.get("comparison"), hide_index=True, width='stretch')
+
+        st.markdown("<p style='color:#000;'>Tip: use the Play button beside the decision boundary to animate the boundary slightly for intuition.</p>", unsafe_allow_html=True)
+
+        # Decision Boundary Plot setup
+        xx, yy = graph.get("grid")
+
+        model_place = st.empty()
+
+        def render_model_frame(jitter, model=model, quality=FULL):
+            Xj, Z = decision_surface(model, X, y, xx, yy, jitter=jitter)
+            return plots.render_model_frame(xx, yy, Z, Xj, y, f"{model_name} Decision Boundary (animated)",
+                                            dpi=quality.dpi, encoding=encoding)
+
+        # animation (one frame per scheduler tick)
+        interval = frame_interval(st.session_state.get('speed_model', 1.0))
+        with model_place:
+            playing = animate(
+                "model",
+                # jittered frames are interchangeable, so a 30-frame cycle is
+                # shared; the producer refits its own model instance
+                lambda tick, quality: shared_frame(
+                    "model", ("model", dataset_name, model_name, quality, encoding),
+                    lambda i: render_model_frame(0.03, model=jitter_model(model_name, model), quality=quality), tick,
+                    period=30, timeout=interval
+                ),
+                playing_key="playing_model",
+                interval=interval,
+                max_ticks=301,
+                loop_key="loop_model",
+                image_kwargs=dict(width='stretch'),
+            )
+        @graph.node("frame", inputs=["me_model", "frame_format", "frame_quality"], deps=["dataset", "grid"])
+        def _(dataset, grid):
+            return store.fetch(lambda: render_model_frame(0.0, model=make_model(model_name)),
+                               "model_frame", dataset_name, model_name, encoding)
+
+        if not playing:
+            with model_place:
+                show(graph.get("frame"), width='stretch')
@@ -0,0 +1,108 @@
+"""Analog signal simulation page."""
+import streamlit as st
+
+from optivion import plots
+from optivion.export import capture_frames_from_func, create_frames_zip_bytes
+from optivion.graph import ComputeGraph
+from optivion.quality import FULL
+from optivion.scheduler import animate, frame_interval, shared_frame
+from optivion.theme import footer
+from optivion.transport import format_controls, show
+
+
+def render():
+    # Simulation page — controls left, canvas right, help in expander
+    controls_col, view_col = st.columns([1,2])
+
+    with controls_col:
+        with st.expander("Controls", expanded=True):
+            # sliders for simulation
+            if "freq" not in st.session_state:
+                st.session_state.freq = 2.0
+            if "amp" not in st.session_state:
+                st.session_state.amp = 1.0
+            if "noise" not in st.session_state:
+                st.session_state.noise = 0.05
+
+            freq = st.slider("Frequency (Hz)", 1.0, 10.0, value=st.session_state.freq, step=0.1, key="freq")
+            amp = st.slider("Amplitude", 0.5, 5.0, value=st.session_state.amp, step=0.1, key="amp")
+            noise = st.slider("Noise Level", 0.0, 0.5, value=st.session_state.noise, step=0.01, key="noise")
+
+            # animation controls
+            if "playing_sim" not in st.session_state:
+                st.session_state.playing_sim = False
+            if "speed_sim" not in st.session_state:
+                st.session_state.speed_sim = 1.0
+            if "loop_sim" not in st.session_state:
+                st.session_state.loop_sim = False
+
+            sim_play_col1, sim_play_col2 = st.columns([1,1])
+            with sim_play_col1:
+                if st.button("Play Signal", key="play_signal"):
+                    st.session_state.playing_sim = True
+            with sim_play_col2:
+                if st.button("Stop Signal", key="stop_signal"):
+                    st.session_state.playing_sim = False
+
+            st.slider("Speed", 0.25, 4.0, value=st.session_state.speed_sim, step=0.25, key="speed_sim")
+            st.checkbox("Loop", value=st.session_state.loop_sim, key="loop_sim")
+
+            encoding = format_controls()
+
+            st.markdown("---")
+            with st.expander("Help / Tips", expanded=False):
+                st.write("Increase noise to test signal robustness. Use Play to animate and capture frames for export.")
+
+    with view_col:
+        st.markdown("<p style='font-size:15px; color:#222; margin-bottom:8px;'>This simulates continuous analog signals with noise, unlike discrete digital signals.</p>", unsafe_allow_html=True)
+        st.markdown("<h1 style='margin-top:6px;'>Analog Signal Simulation</h1>", unsafe_allow_html=True)
+        sim_placeholder = st.empty()
+
+        freq, amp, noise = st.session_state.freq, st.session_state.amp, st.session_state.noise
+
+        def render_signal_frame(phase, quality=FULL):
+            return plots.render_signal_frame(freq, amp, noise, phase, dpi=quality.dpi, samples=quality.samples,
+                                             encoding=encoding)
+
+        interval = frame_interval(st.session_state.get('speed_sim', 1.0))
+        with sim_placeholder:
+            playing = animate(
+                "sim",
+                # 157 ticks * 0.12 rad ~= 6*pi, so the shared stream can cycle
+                lambda tick, quality: shared_frame(
+                    "sim", ("sim", freq, amp, noise, quality, encoding),
+                    lambda i: render_signal_frame(i * 0.12, quality), tick, period=157, timeout=interval
+                ),
+                playing_key="playing_sim",
+                interval=interval,
+                max_ticks=201,
+                loop_key="loop_sim",
+                image_kwargs=dict(width='stretch'),
+            )
+        graph = ComputeGraph("simulation")
+
+        @graph.node("frame", inputs=["freq", "amp", "noise", "frame_format", "frame_quality"])
+        def _():
+            return render_signal_frame(0)
+
+        if not playing:
+            with sim_placeholder:
+                show(graph.get("frame"), width='stretch')
+
+        # Frame capture & export for simulation
+        sim_col1, sim_col2 = st.columns([3,1])
+        with sim_col1:
+            sim_n = st.number_input("Simulation export frames", min_value=1, max_value=200, value=20, step=1, key='sim_export_n')
+        with sim_col2:
+            if st.button("Capture Signal Frames", key='sim_capture'):
+                def sim_frame_func(i):
+                    return plots.render_signal_thumb(
+                        st.session_state.freq, st.session_state.amp, st.session_state.noise, i * 0.12
+                    )
+                frames = capture_frames_from_func(sim_frame_func, n_frames=sim_n)
+                zip_bytes = create_frames_zip_bytes(frames, prefix='sim')
+                st.download_button("Download simulation frames (zip)", data=zip_bytes, file_name="simulation_frames.zip", mime="application/zip")
+
+
+    # Footer for Simulation page (kept intact)
+    footer()
@@ -0,0 +1,130 @@
+"""Frame renderers shared by the pages and the batch CLI.
+
+Figures are built with ``matplotlib.figure.Figure`` rather than pyplot so
+rendering is free of global state and safe from worker threads/processes.
+Every renderer takes an optional ``encoding`` (see ``optivion.transport``);
+with one, the frame comes back as bytes from a single encode.
+"""
+import io
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.figure import Figure
+from PIL import Image
+
+from optivion.fields import generate_2d_field
+from optivion.transport import encode_array, encode_figure
+
+
+# Helper: rasterize a figure to a PIL image
+def figure_to_image(fig, dpi=120, mode='RGB'):
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', dpi=dpi)
+    buf.seek(0)
+    return Image.open(buf).convert(mode)
+
+
+# Helper: encoded bytes when an Encoding is given, else a decoded image
+def _finish(fig, dpi, mode='RGB', encoding=None):
+    if encoding is not None:
+        return encode_figure(fig, dpi, encoding)
+    return figure_to_image(fig, dpi=dpi, mode=mode)
+
+
+# 1D interference: two sines and their resultant
+def render_1d_frame(wavelength, phase_diff_deg, dpi=120, samples=500, encoding=None):
+    fig = Figure(figsize=(8,2.5))
+    ax = fig.subplots()
+    x = np.linspace(0, 10, samples)
+    y1 = np.sin(2 * np.pi * x / wavelength)
+    y2 = np.sin(2 * np.pi * x / wavelength + np.deg2rad(phase_diff_deg % 360))
+    resultant = y1 + y2
+    ax.plot(x, y1, label="Wave 1", linestyle="--", alpha=0.6)
+    ax.plot(x, y2, label="Wave 2", linestyle="--", alpha=0.6)
+    ax.plot(x, resultant, label="Resultant")
+    ax.set_title("Light Interference Pattern (animated)")
+    ax.set_xlabel("Position")
+    ax.set_ylabel("Amplitude")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    return _finish(fig, dpi, encoding=encoding)
+
+
+# 2D interference viewer frame (grayscale array)
+def render_2d_frame(wavelength, phase_diff_deg, size, separation=10.0, dpi=120, encoding=None):
+    arr = generate_2d_field(
+        wavelength=wavelength,
+        phase_diff_deg=phase_diff_deg % 360,
+        size=size,
+        separation=separation
+    )
+    return render_field_image(arr, dpi=dpi, encoding=encoding)
+
+
+# Helper: plot a precomputed 2D field the way the viewer shows it
+def render_field_image(arr, dpi=120, encoding=None):
+    fig = Figure(figsize=(8,2.5))
+    ax = fig.subplots()
+    ax.imshow(arr, cmap='gray', aspect='auto')
+    ax.axis('off')
+    if encoding is not None:
+        return encode_figure(fig, dpi, encoding)
+    return np.array(figure_to_image(fig, dpi=dpi, mode='L'))
+
+
+# Fast path for precomputed fields: same layout as render_field_image
+# (axes area of the figure plus the savefig pad) but via a PIL resize,
+# so no matplotlib draw is needed
+def field_to_image(arr, dpi=120, figsize=(8,2.5), encoding=None):
+    w = round(figsize[0] * (rcParams['figure.subplot.right'] - rcParams['figure.subplot.left']) * dpi)
+    h = round(figsize[1] * (rcParams['figure.subplot.top'] - rcParams['figure.subplot.bottom']) * dpi)
+    pad = round(rcParams['savefig.pad_inches'] * dpi)
+    mode = 'RGB' if arr.ndim == 3 else 'L'
+    canvas = Image.new(mode, (w + 2 * pad, h + 2 * pad), (255,) * len(mode))
+    canvas.paste(Image.fromarray(arr).resize((w, h), Image.BILINEAR), (pad, pad))
+    if encoding is not None:
+        return encode_array(np.asarray(canvas), encoding)
+    return np.array(canvas)
+
+
+# Helper: noisy sine samples for the analog simulation
+def signal_samples(freq, amp, noise, phase, rng=np.random, samples=500):
+    t = np.linspace(0, 2, samples)
+    y1 = amp * np.sin(2 * np.pi * freq * t + phase)
+    noise_data = rng.normal(0, noise, size=t.shape)
+    return t, y1 + noise_data
+
+
+# Analog signal frame with cosine reference
+def render_signal_frame(freq, amp, noise, phase, dpi=120, rng=np.random, samples=500, encoding=None):
+    t, sig = signal_samples(freq, amp, noise, phase, rng=rng, samples=samples)
+    fig = Figure(figsize=(8,3))
+    ax = fig.subplots()
+    ax.plot(t, sig, label="Analog Signal (sine)")
+    ax.plot(t, amp * np.cos(2 * np.pi * freq * t), label="Cosine Reference", linestyle="--", alpha=0.7)
+    ax.set_xlabel("Time (s)")
+    ax.set_ylabel("Amplitude")
+    ax.set_ylim(-6,6)
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc="upper right")
+    return _finish(fig, dpi, encoding=encoding)
+
+
+# Small black-on-white signal strip used for frame export
+def render_signal_thumb(freq, amp, noise, phase, dpi=80, rng=np.random):
+    t, sig = signal_samples(freq, amp, noise, phase, rng=rng)
+    fig = Figure(figsize=(4,1))
+    ax = fig.subplots()
+    ax.plot(t, sig, color='black')
+    ax.axis('off')
+    return np.array(figure_to_image(fig, dpi=dpi, mode='L'))
+
+
+# Decision boundary over a precomputed grid
+def render_model_frame(xx, yy, Z, Xj, y, title, dpi=120, encoding=None):
+    fig = Figure(figsize=(6,4))
+    ax = fig.subplots()
+    ax.contourf(xx, yy, Z, alpha=0.6, cmap='coolwarm')
+    ax.scatter(Xj[:, 0], Xj[:, 1], c=y, cmap='coolwarm', edgecolors="k")
+    ax.set_title(title)
+    return _finish(fig, dpi, encoding=encoding)
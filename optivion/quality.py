@@ -0,0 +1,91 @@
+"""Adaptive quality governor for animations.
+
+Each playing animation measures how long a frame takes to produce and
+steps down a small ladder of quality levels (figure dpi, 1D sample count,
+2D resolution scale) when frames can't keep up with the interval set by
+the Speed slider, and back up once there is headroom again. Stopping an
+animation discards its governor, so the next Play starts at full quality.
+"""
+import threading
+import time
+from collections import namedtuple
+
+Quality = namedtuple("Quality", ["dpi", "samples", "scale"])
+
+LEVELS = [
+    Quality(dpi=120, samples=500, scale=1.0),
+    Quality(dpi=100, samples=350, scale=0.75),
+    Quality(dpi=80, samples=250, scale=0.5),
+    Quality(dpi=60, samples=150, scale=0.375),
+]
+
+FULL = LEVELS[0]
+
+_reported = threading.local()
+
+
+# Report what the frame being drawn really cost (a shared producer's render time),
+# so ``QualityGovernor.run`` records that instead of how long the caller waited
+def report_frame_time(seconds):
+    _reported.seconds = seconds
+
+
+# Helper: 2D resolution for a quality level (never below 64 pixels)
+def scaled_size(size, quality):
+    return max(64, int(round(size * quality.scale)))
+
+
+class QualityGovernor:
+    """Holds a target frame time by moving between ``LEVELS``."""
+
+    def __init__(self, levels=LEVELS, smoothing=0.3, down_at=0.9, up_at=0.45, up_after=8):
+        self.levels = levels
+        self.smoothing = smoothing
+        self.down_at = down_at
+        self.up_at = up_at
+        self.up_after = up_after
+        self.level = 0
+        self._ema = None
+        self._fast = 0
+
+    @property
+    def quality(self):
+        return self.levels[self.level]
+
+    # Feed one frame time; ``budget`` is the target seconds per frame
+    def record(self, seconds, budget):
+        a = self.smoothing
+        self._ema = seconds if self._ema is None else a * seconds + (1 - a) * self._ema
+        if self._ema > budget * self.down_at and self.level < len(self.levels) - 1:
+            self.level += 1
+            self._ema = None
+            self._fast = 0
+        elif self._ema < budget * self.up_at and self.level > 0:
+            self._fast += 1
+            if self._fast >= self.up_after:
+                self.level -= 1
+                self._ema = None
+                self._fast = 0
+        else:
+            self._fast = 0
+        return self.quality
+
+    # Time ``func(quality)`` and record it against ``budget``, or record the time
+    # ``func`` reported with ``report_frame_time``: a shared frame's wait is capped
+    # at the budget and says nothing about render cost. An unreported None result
+    # (shared stream with no frame yet) isn't recorded.
+    def run(self, func, budget):
+        _reported.seconds = None
+        t0 = time.perf_counter()
+        result = func(self.quality)
+        seconds = _reported.seconds
+        if seconds is None and result is not None:
+            seconds = time.perf_counter() - t0
+        if seconds is not None:
+            self.record(seconds, budget)
+        return result
+
+    def reset(self):
+        self.level = 0
+        self._ema = None
+        self._fast = 0
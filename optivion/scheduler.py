@@ -0,0 +1,118 @@
+"""Non-blocking animation scheduler built on ``st.fragment(run_every=...)``.
+
+Instead of a ``while playing: ...; time.sleep()`` loop holding the script
+thread, each Play feature renders exactly one frame per fragment tick and
+returns. Stop buttons take effect on the next interaction, and a session
+that disconnects simply stops receiving ticks.
+
+A process-wide token bucket (``FRAME_CAP``) limits the total number of
+frames rendered per second across all sessions; a tick that finds the
+bucket empty re-shows its previous frame instead of rendering a new one.
+"""
+import os
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from optivion.broadcast import BROADCASTER, WAIT_SECONDS
+from optivion.quality import QualityGovernor, report_frame_time
+from optivion.transport import show
+
+
+class FrameRateCap:
+    """Thread-safe token bucket shared by every session in the process."""
+
+    def __init__(self, max_fps, burst=None):
+        self.rate = float(max_fps)
+        self.capacity = float(burst if burst is not None else max(1.0, self.rate / 10))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+FRAME_CAP = FrameRateCap(float(os.environ.get("OPTIVION_MAX_FPS", 60)))
+
+
+# Helper: tick interval for a Speed slider value (same formula as the old loops)
+def frame_interval(speed):
+    speed = max(0.25, float(speed))
+    return max(0.01, 0.12 / speed)
+
+
+# Helper: id of the session running the current script (None outside Streamlit)
+def session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+# Frame ``tick`` of animation ``name`` via the cross-session broadcaster:
+# sessions passing an equal ``key`` share one producer. ``render(index)``
+# runs on the producer thread, so it must not touch st.session_state.
+# Returns None if the frame isn't ready within ``timeout`` (pass the
+# animation interval so a slow producer skips ticks instead of stalling).
+# The producer's render time is what the quality governor records.
+def shared_frame(name, key, render, tick, period=None, timeout=WAIT_SECONDS):
+    sid = session_id()
+    if sid is None:
+        return render(tick % period if period else tick)
+    frame, seconds = BROADCASTER.frame(sid, name, key, render, tick, period=period, timeout=timeout)
+    report_frame_time(seconds)
+    return frame
+
+
+# Run ``draw(tick, quality)`` once per ``interval`` seconds while
+# ``st.session_state[playing_key]`` is set. ``draw`` returns the frame (or
+# None to keep showing the previous one without advancing), which is shown with ``transport.show(frame, **image_kwargs)``; ``quality`` comes
+# from a per-session QualityGovernor timing each draw against ``interval``.
+# Without looping the animation ends after ``max_ticks`` frames and the app
+# reruns once so the fragment timer is dropped.
+def animate(name, draw, playing_key, interval, max_ticks=None, loop_key=None, image_kwargs=None):
+    tick_key = f"_anim_tick_{name}"
+    last_key = f"_anim_last_{name}"
+    governor_key = f"_anim_quality_{name}"
+    image_kwargs = image_kwargs or {}
+
+    if not st.session_state.get(playing_key, False):
+        st.session_state.pop(tick_key, None)
+        st.session_state.pop(last_key, None)
+        st.session_state.pop(governor_key, None)  # next Play starts at full quality
+        sid = session_id()
+        if sid is not None:
+            BROADCASTER.release(sid, name)
+        return False
+
+    def _tick():
+        if not st.session_state.get(playing_key, False):
+            return
+        tick = st.session_state.get(tick_key, 0)
+        frame = st.session_state.get(last_key)
+        governor = st.session_state.setdefault(governor_key, QualityGovernor())
+        if frame is None or FRAME_CAP.try_acquire():
+            fresh = governor.run(lambda quality: draw(tick, quality), interval)
+            if fresh is not None:  # None: shared frame not ready, keep the previous one
+                frame = st.session_state[last_key] = fresh
+                st.session_state[tick_key] = tick = tick + 1
+        if frame is not None:
+            show(frame, **image_kwargs)
+        if governor.level > 0:
+            st.caption(f"Reduced quality ({governor.quality.dpi} dpi) to hold {1 / interval:.0f} fps")
+
+        looping = loop_key is not None and st.session_state.get(loop_key, False)
+        if max_ticks is not None and not looping and tick >= max_ticks:
+            st.session_state[playing_key] = False
+            st.rerun(scope="app")
+
+    st.fragment(_tick, run_every=interval)()
+    return True
@@ -0,0 +1,69 @@
+"""Spectral profiles and colour matching for broadband fields.
+
+The colour-matching table is the CIE 1931 2° observer. It uses the
+multi-lobe Gaussian fit of Wyman, Sloan & Shirley (2013), is evaluated
+once on a 1 nm grid over 380-780 nm and converted to linear sRGB. Scene
+units map to nanometres as 1 unit = 100 nm, so the Interference
+wavelength slider (1-10) covers 100-1000 nm.
+"""
+import numpy as np
+
+PROFILES = ["Gaussian", "Flat (white)", "Blackbody"]
+VISIBLE_NM = (380.0, 780.0)
+NM_PER_UNIT = 100.0
+
+XYZ_TO_SRGB = np.array([
+    [3.2406, -1.5372, -0.4986],
+    [-0.9689, 1.8758, 0.0415],
+    [0.0557, -0.2040, 1.0570],
+])
+
+
+def _lobe(nm, mu, sigma_lo, sigma_hi):
+    sigma = np.where(nm < mu, sigma_lo, sigma_hi)
+    return np.exp(-0.5 * ((nm - mu) / sigma) ** 2)
+
+
+def _cie_xyz(nm):
+    x = 1.056 * _lobe(nm, 599.8, 37.9, 31.0) + 0.362 * _lobe(nm, 442.0, 16.0, 26.7) - 0.065 * _lobe(nm, 501.1, 20.4, 26.2)
+    y = 0.821 * _lobe(nm, 568.8, 46.9, 40.5) + 0.286 * _lobe(nm, 530.9, 16.3, 31.1)
+    z = 1.217 * _lobe(nm, 437.0, 11.8, 36.0) + 0.681 * _lobe(nm, 459.0, 26.0, 13.8)
+    return np.stack([x, y, z], axis=-1)
+
+
+# Precomputed table: linear-sRGB response per nanometre
+CMF_NM = np.arange(VISIBLE_NM[0], VISIBLE_NM[1] + 1.0)
+CMF_RGB = _cie_xyz(CMF_NM) @ XYZ_TO_SRGB.T
+
+
+# Helper: linear RGB response at arbitrary wavelengths (table lookup)
+def wavelength_rgb(nm):
+    return np.stack([np.interp(nm, CMF_NM, CMF_RGB[:, c], left=0.0, right=0.0) for c in range(3)], axis=-1)
+
+
+# Wavelength samples (nm) and relative power for a spectral profile. Narrow
+# Gaussians are sampled across their own support, not the whole visible band;
+# their centre is clamped to the visible band (callers should say so).
+def sample_spectrum(profile, n=300, center_nm=550.0, bandwidth_nm=40.0, temperature=5800.0):
+    lo, hi = VISIBLE_NM
+    if profile == "Gaussian":
+        center_nm = float(np.clip(center_nm, lo, hi))
+        lo, hi = max(lo, center_nm - 2 * bandwidth_nm), min(hi, center_nm + 2 * bandwidth_nm)
+    nm = np.linspace(lo, hi, int(n))
+    if profile == "Gaussian":
+        sigma = bandwidth_nm / 2.3548  # FWHM -> standard deviation
+        power = np.exp(-0.5 * ((nm - center_nm) / sigma) ** 2)
+    elif profile == "Blackbody":
+        power = nm ** -5.0 / np.expm1(1.4388e7 / (nm * temperature))  # Planck, hc/k in nm·K
+    elif profile == "Flat (white)":
+        power = np.ones_like(nm)
+    else:
+        raise ValueError(f"unknown spectral profile {profile!r}")
+    return nm, power / power.sum()
+
+
+# Helper: linear RGB in [0, 1] -> sRGB-encoded uint8
+def to_srgb8(linear):
+    linear = np.clip(linear, 0.0, 1.0)
+    encoded = np.where(linear <= 0.0031308, 12.92 * linear, 1.055 * linear ** (1 / 2.4) - 0.055)
+    return (encoded * 255 + 0.5).astype(np.uint8)
@@ -0,0 +1,209 @@
+"""Persistent, content-addressed artifact store shared across processes.
+
+    frame = default_store().fetch(lambda: render(...), "interf_2d", wl, pd, size, encoding)
+
+Artifacts live one file per SHA-256 key of their inputs (arrays as
+memory-mapped ``.npy``), written atomically, with a WAL-mode sqlite index
+driving LRU eviction above ``max_bytes``. ``OPTIVION_STORE_DIR`` and
+``OPTIVION_STORE_MB`` (0 disables it) set the location and cap.
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_DIR = Path(os.environ.get("OPTIVION_STORE_DIR", Path.home() / ".cache" / "optivion" / "store"))
+MAX_BYTES = int(float(os.environ.get("OPTIVION_STORE_MB", 1024)) * 2**20)
+VERSION = 1  # bump to orphan every stored artifact after a renderer change
+EVICT_TO = 0.9  # evict down to this fraction of max_bytes
+TOUCH_SECONDS = 60.0  # a hit only rewrites last_access once it is this stale
+
+_KINDS = {"array": ".npy", "bytes": ".bin", "pickle": ".pkl"}
+
+
+def _feed(h, part):
+    if isinstance(part, np.ndarray):
+        h.update(f"nd{part.dtype.str}{part.shape}".encode())
+        h.update(np.ascontiguousarray(part).tobytes())
+    elif isinstance(part, (bytes, bytearray)):
+        h.update(b"b%d:" % len(part))
+        h.update(part)
+    elif isinstance(part, (tuple, list)):
+        h.update(b"(")
+        for p in part:
+            _feed(h, p)
+        h.update(b")")
+    else:
+        h.update(f"{type(part).__name__}:{part!r};".encode())
+
+
+# Helper: content address (hex SHA-256) for a tuple of inputs
+def content_key(*parts):
+    h = hashlib.sha256(b"optivion-store-v%d;" % VERSION)
+    _feed(h, parts)
+    return h.hexdigest()
+
+
+class ArtifactStore:
+    """Disk-backed key -> artifact map with a size cap and LRU eviction."""
+
+    def __init__(self, directory=DEFAULT_DIR, max_bytes=MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        if self.enabled:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self._db() as db:
+                db.execute("CREATE TABLE IF NOT EXISTS entries "
+                           "(key TEXT PRIMARY KEY, kind TEXT, size INTEGER, last_access REAL)")
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    # One connection per thread; sqlite serializes writers across processes
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.directory / "index.sqlite", timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _path(self, key, kind):
+        return self.directory / key[:2] / f"{key}{_KINDS[kind]}"
+
+    # Stored artifact for ``key`` (arrays memory-mapped), or ``default``
+    def get(self, key, default=None):
+        if not self.enabled:
+            return default
+        db = self._db()
+        row = db.execute("SELECT kind, last_access FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return default
+        path = self._path(key, row[0])
+        try:
+            if row[0] == "array":
+                value = np.load(path, mmap_mode="r")
+            elif row[0] == "bytes":
+                value = path.read_bytes()
+            else:
+                with open(path, "rb") as fh:
+                    value = pickle.load(fh)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            # evicted by another process between the lookup and the read
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.misses += 1
+            return default
+        # LRU only needs coarse recency, and skipping the write keeps hits off the write lock
+        now = time.time()
+        if now - row[1] > TOUCH_SECONDS:
+            db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return value
+
+    # Store ``value`` under ``key`` (atomic file write, then index), evicting if over the cap
+    def put(self, key, value):
+        if not self.enabled:
+            return value
+        if isinstance(value, np.ndarray):
+            kind = "array"
+        elif isinstance(value, (bytes, bytearray)):
+            kind = "bytes"
+        else:
+            kind = "pickle"
+        path = self._path(key, kind)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(exist_ok=True)
+            with open(tmp, "wb") as fh:
+                if kind == "array":
+                    np.save(fh, value, allow_pickle=False)
+                elif kind == "bytes":
+                    fh.write(value)
+                else:
+                    pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                fh.flush()
+                # sized before the rename: once in place, another process may evict (unlink) it
+                size = os.fstat(fh.fileno()).st_size
+            os.replace(tmp, path)
+        except OSError:
+            # not cached (e.g. disk full); the caller still gets its value
+            tmp.unlink(missing_ok=True)
+            return value
+        self._db().execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (key, kind, size, time.time()))
+        self._evict()
+        return value
+
+    # Stored artifact for ``parts`` if present, else ``compute()`` stored and returned
+    def fetch(self, compute, *parts):
+        if not self.enabled:
+            return compute()
+        key = content_key(*parts)
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    # Drop least-recently-used entries until total size <= EVICT_TO * max_bytes
+    def _evict(self):
+        db = self._db()
+        if (db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]) <= self.max_bytes:
+            return
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            target = self.max_bytes * EVICT_TO
+            victims = []
+            for key, kind, size in db.execute("SELECT key, kind, size FROM entries ORDER BY last_access"):
+                if total <= target:
+                    break
+                victims.append((key, kind))
+                total -= size
+            db.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k, _ in victims])
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        # open memmaps elsewhere keep their data on POSIX; a failed unlink (a mapped
+        # file on Windows) just leaves an unindexed file behind
+        for key, kind in victims:
+            try:
+                self._path(key, kind).unlink()
+            except OSError:
+                pass
+
+    def stats(self):
+        if not self.enabled:
+            return {"enabled": False}
+        entries, size = self._db().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"enabled": True, "directory": str(self.directory), "entries": entries, "bytes": size,
+                "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        if not self.enabled:
+            return
+        db = self._db()
+        rows = db.execute("SELECT key, kind FROM entries").fetchall()
+        db.execute("DELETE FROM entries")
+        for key, kind in rows:
+            try:
+                self._path(key, kind).unlink()
+            except OSError:
+                pass
+
+
+# Process-wide store (created on first use, so importing this module has no side effects)
+@lru_cache(maxsize=None)
+def default_store():
+    return ArtifactStore()
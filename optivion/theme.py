@@ -0,0 +1,36 @@
+"""Shared page chrome: the consolidated stylesheet, logo and footer."""
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+STYLE_PATH = Path(__file__).with_name("style.css")
+
+LOGO_HTML = """
+<div class="logo-container">
+<span>Optivion</span>
+</div>
+"""
+
+FOOTER_HTML = """
+    <div class="footer">
+        <p>© 2025 Optivion. Built with passion and innovation.</p>
+        <p>Contact: <a href="mailto:shreyasigh03@gmail.com">shreyasigh03@gmail.com</a></p>
+    </div>
+"""
+
+
+# Read the stylesheet once per process; every rerun reuses the same string
+@lru_cache(maxsize=None)
+def _style_block():
+    return f"<style>\n{STYLE_PATH.read_text(encoding='utf-8')}\n</style>{LOGO_HTML}"
+
+
+def inject_styles():
+    # Streamlit drops elements not emitted on a rerun, so this is one
+    # markdown element per run instead of the old eight separate blocks
+    st.markdown(_style_block(), unsafe_allow_html=True)
+
+
+def footer():
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
@@ -0,0 +1,95 @@
+"""Frame transport: encode each preview frame exactly once.
+
+Renderers given an ``Encoding`` return encoded bytes straight from
+``savefig`` (or one PIL save for array frames) instead of PNG -> decode ->
+re-encode. ``show`` hands those bytes to the browser untouched: JPEG and
+PNG go through ``st.image`` with their format set explicitly (under
+"auto" it would re-encode opaque PNGs as JPEG); WebP, which
+``st.image`` would transcode to JPEG, is sent as an inline ``<img>``.
+"""
+import base64
+import io
+import os
+from collections import namedtuple
+
+import numpy as np
+from PIL import Image
+
+Encoding = namedtuple("Encoding", ["format", "quality"])
+
+FORMATS = ["jpeg", "webp", "png"]
+MIME_TYPES = {"jpeg": "image/jpeg", "webp": "image/webp", "png": "image/png"}
+
+DEFAULT = Encoding(
+    format=os.environ.get("OPTIVION_FRAME_FORMAT", "jpeg"),
+    quality=int(os.environ.get("OPTIVION_FRAME_QUALITY", 80)),
+)
+
+
+def _pil_kwargs(encoding):
+    if encoding.format == "png":
+        return {}
+    if encoding.format == "webp":
+        # method 0 is libwebp's fastest setting; these are live frames
+        return {"quality": int(encoding.quality), "method": 0}
+    return {"quality": int(encoding.quality)}
+
+
+# Encode a matplotlib figure once, straight to the target format
+def encode_figure(fig, dpi, encoding):
+    buf = io.BytesIO()
+    fig.savefig(buf, format=encoding.format, bbox_inches='tight', dpi=dpi, pil_kwargs=_pil_kwargs(encoding))
+    return buf.getvalue()
+
+
+# Encode a uint8 array (grayscale or RGB) once
+def encode_array(arr, encoding):
+    buf = io.BytesIO()
+    Image.fromarray(arr).save(buf, format=encoding.format.upper(), **_pil_kwargs(encoding))
+    return buf.getvalue()
+
+
+# Helper: frame (encoded bytes, PIL image or array) as a numpy array
+def to_array(frame):
+    if isinstance(frame, (bytes, bytearray)):
+        frame = Image.open(io.BytesIO(frame))
+    return np.asarray(frame)
+
+
+# Helper: "png" / "jpeg" / "webp" from an encoded frame's magic bytes, else None
+def sniff_format(frame):
+    if not isinstance(frame, (bytes, bytearray)):
+        return None
+    if frame[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if frame[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if frame[:4] == b"RIFF" and frame[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+# Display a frame in the current Streamlit container without re-encoding it
+def show(frame, **image_kwargs):
+    import streamlit as st
+
+    fmt = sniff_format(frame)
+    if fmt == "webp":
+        b64 = base64.b64encode(frame).decode("ascii")
+        st.html(f'<img src="data:image/webp;base64,{b64}" style="width:100%; height:auto;">')
+    else:
+        if fmt is not None:
+            # st.image's "auto" format treats any opaque PNG as JPEG and re-encodes it
+            image_kwargs.setdefault("output_format", fmt.upper())
+        st.image(frame, **image_kwargs)
+
+
+# Format / quality widgets; returns the selected Encoding
+def format_controls():
+    import streamlit as st
+
+    fmt = st.selectbox("Frame format", FORMATS, index=FORMATS.index(DEFAULT.format), key="frame_format",
+                       help="Preview frames are encoded once in this format and sent as-is.")
+    quality = st.slider("Frame quality", 10, 100, value=DEFAULT.quality, step=5, key="frame_quality",
+                        disabled=fmt == "png")
+    return Encoding(fmt, quality)
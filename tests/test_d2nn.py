@@ -0,0 +1,49 @@
+import copy
+
+import numpy as np
+import pytest
+
+from optivion.d2nn import DiffractiveNetwork
+
+
+@pytest.fixture
+def fitted():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(16, 2)).astype(np.float32)
+    y = rng.integers(0, 2, size=16)
+    return DiffractiveNetwork(layers=2, size=16, epochs=1).fit(X, y), X, y
+
+
+def test_gradient_matches_central_differences(fitted):
+    net, X, y = fitted
+    _, grad = net._loss_and_grad(X, y)
+    eps = 1e-2
+    # the largest entries, so float32 rounding stays well below the signal
+    for flat in np.argsort(-np.abs(grad).ravel())[:5]:
+        i = np.unravel_index(flat, grad.shape)
+        phases = net.phases_.copy()
+        net.phases_[i] += eps
+        up, _ = net._loss_and_grad(X, y)
+        net.phases_[i] -= 2 * eps
+        down, _ = net._loss_and_grad(X, y)
+        net.phases_ = phases
+        assert (up - down) / (2 * eps) == pytest.approx(grad[i], rel=1e-3, abs=1e-5)
+
+
+def test_folded_readout_matches_layer_by_layer_forward(fitted):
+    net, X, _ = fitted
+    energy, _ = net._forward(X)
+    expected = energy / energy.sum(axis=1, keepdims=True)
+    np.testing.assert_allclose(net.predict_proba(X), expected, rtol=1e-4, atol=1e-6)
+
+
+def test_warm_start_continues_from_fitted_masks(fitted):
+    net, X, y = fitted
+    warm = copy.deepcopy(net)
+    warm.warm_start, warm.epochs = True, 0
+    warm.fit(X, y)
+    np.testing.assert_array_equal(warm.phases_, net.phases_)
+    cold = copy.deepcopy(net)
+    cold.epochs = 0
+    cold.fit(X, y)
+    assert not np.array_equal(cold.phases_, net.phases_)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from optivion.diffraction import fraunhofer, make_aperture
+
+
+def dense_fraunhofer(u0, wavelength, distance, dx):
+    n = u0.shape[0]
+    x = (np.arange(n) - (n - 1) / 2) * dx
+    lz = wavelength * distance
+    A = np.exp((-2j * np.pi / lz) * np.outer(x, x))
+    chirp = np.exp((1j * np.pi / lz) * x ** 2)
+    scale = np.exp(2j * np.pi * distance / wavelength) / (1j * lz) * dx * dx
+    return A @ u0 @ A.T * (scale * np.outer(chirp, chirp))
+
+
+@pytest.mark.parametrize("wavelength, distance", [(5.0, 40.0), (1.0, 3.0), (2.0, 150.0)])
+def test_chirp_z_far_field_matches_dense_dft(wavelength, distance):
+    u0 = make_aperture("Double slit", 96, extent=80.0)
+    dx = 80.0 / 95
+    got = fraunhofer(u0, wavelength, distance, dx)
+    want = dense_fraunhofer(u0.astype(np.complex128), wavelength, distance, dx)
+    assert np.linalg.norm(got - want) / np.linalg.norm(want) < 1e-5
+
+
+def test_far_field_intensity_depends_on_wavelength_times_distance():
+    u0 = make_aperture("Grating", 128, extent=80.0)
+    dx = 80.0 / 127
+    a = np.abs(fraunhofer(u0, 2.0, 60.0, dx)) ** 2
+    b = np.abs(fraunhofer(u0, 4.0, 30.0, dx)) ** 2
+    c = np.abs(fraunhofer(u0, 4.0, 60.0, dx)) ** 2
+    np.testing.assert_allclose(a, b, rtol=1e-3, atol=1e-6 * a.max())
+    assert not np.allclose(a / a.max(), c / c.max(), atol=1e-2)
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from optivion.fields import generate_broadband_field, path_difference
+from optivion.spectrum import NM_PER_UNIT, sample_spectrum, to_srgb8, wavelength_rgb
+
+
+# Reference: integrate every wavelength at every pixel, no Δr table
+def direct_broadband(nm, power, phase_deg, size, separation):
+    weights = power[:, None] * wavelength_rgb(nm)
+    k = 2 * np.pi * NM_PER_UNIT / nm
+    dr = path_difference(size, float(separation)).ravel().astype(np.float64)
+    out = np.zeros((dr.size, 3))
+    for ki, w in zip(k, weights):
+        out += np.outer(1 + np.cos(ki * dr + np.deg2rad(phase_deg)), w)
+    out /= 2 * weights.sum(axis=0).max()
+    return to_srgb8(out).reshape(size, size, 3)
+
+
+@pytest.mark.parametrize("profile", ["Flat (white)", "Gaussian"])
+@pytest.mark.parametrize("separation", [10.0, 20.0, 40.0])
+def test_broadband_matches_direct_integration(profile, separation):
+    nm, power = sample_spectrum(profile, 300)
+    got = generate_broadband_field(nm, power, 30.0, size=128, separation=separation)
+    want = direct_broadband(nm, power, 30.0, 128, separation)
+    assert np.abs(got.astype(int) - want.astype(int)).max() <= 1
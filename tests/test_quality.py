@@ -0,0 +1,45 @@
+import time
+
+from optivion import scheduler
+from optivion.quality import LEVELS, QualityGovernor, report_frame_time
+
+# seconds to render one frame at each quality level
+COST = {q: c for q, c in zip(LEVELS, (0.10, 0.07, 0.03, 0.01))}
+
+
+def test_run_records_reported_time_over_the_wait():
+    governor = QualityGovernor()
+
+    def draw(quality):
+        report_frame_time(1.0)
+        return None
+    governor.run(draw, budget=0.1)
+    assert governor.level == 1
+
+
+def test_unreported_none_is_not_recorded():
+    governor = QualityGovernor()
+    for _ in range(5):
+        governor.run(lambda quality: time.sleep(0.02), budget=0.01)
+    assert governor.level == 0
+
+
+def test_shared_animation_steps_down_to_hold_the_budget(monkeypatch):
+    monkeypatch.setattr(scheduler, "session_id", lambda: "test-session")
+    budget = 0.04
+    governor = QualityGovernor()
+
+    def render(quality):
+        def frame(index):
+            time.sleep(COST[quality])
+            return index
+        return frame
+
+    try:
+        for tick in range(60):
+            governor.run(lambda quality: scheduler.shared_frame(
+                "governed", ("governed", quality), render(quality), tick, timeout=budget), budget)
+    finally:
+        scheduler.BROADCASTER.release("test-session", "governed")
+    # the highest level whose render time fits the budget
+    assert governor.quality == LEVELS[2]
@@ -0,0 +1,111 @@
+import multiprocessing as mp
+import os
+
+import numpy as np
+import pytest
+
+from optivion import store as store_module
+from optivion.store import ArtifactStore, content_key
+
+
+def expected(k):
+    if k % 3:
+        return np.full((64, 64), k, dtype=np.float32)
+    return b"x" * 5000 if k % 2 else {"k": k}
+
+
+def matches(value, k):
+    want = expected(k)
+    if isinstance(want, np.ndarray):
+        return isinstance(value, np.ndarray) and (value == want).all()
+    return value == want
+
+
+# Worker: fetch overlapping keys in a store small enough to evict continuously
+def hammer(directory, seed):
+    store = ArtifactStore(directory, max_bytes=2**18)
+    rng = np.random.default_rng(seed)
+    wrong = 0
+    for _ in range(200):
+        k = int(rng.integers(0, 40))
+        wrong += not matches(store.fetch(lambda: expected(k), "t", k), k)
+    return wrong
+
+
+def test_content_key_separates_dtypes_and_shapes():
+    a = np.arange(6)
+    assert content_key(a) == content_key(np.arange(6))
+    assert content_key(a) != content_key(a.astype(np.int32))
+    assert content_key(a) != content_key(a.reshape(2, 3))
+
+
+def test_round_trip_kinds(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=2**20)
+    for k in (1, 3, 6):
+        store.put(content_key(k), expected(k))
+        assert matches(store.get(content_key(k)), k)
+    assert not store.get(content_key(1)).flags.writeable  # memory-mapped read-only
+    assert store.get(content_key("missing"), "default") == "default"
+
+
+def test_concurrent_processes_never_see_wrong_values(tmp_path):
+    ArtifactStore(tmp_path, max_bytes=2**18)
+    ctx = mp.get_context("spawn")
+    with ctx.Pool(4) as pool:
+        assert pool.starmap(hammer, [(str(tmp_path), seed) for seed in range(4)]) == [0] * 4
+
+    store = ArtifactStore(tmp_path, max_bytes=2**18)
+    assert store.stats()["bytes"] <= store.max_bytes
+    keys = {content_key("t", k): k for k in range(40)}
+    rows = store._db().execute("SELECT key, kind, size FROM entries").fetchall()
+    for key, kind, size in rows:
+        path = store._path(key, kind)
+        if os.path.exists(path):
+            assert os.path.getsize(path) == size
+            assert matches(store.get(key), keys[key])
+        else:
+            # a re-put can land between another process's eviction and its unlink;
+            # the dangling row reads as a miss and is dropped
+            assert store.get(key) is None
+            assert store._db().execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is None
+
+
+def test_eviction_keeps_recently_used_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(store_module, "TOUCH_SECONDS", 0.0)
+    clock = iter(range(1000))
+    monkeypatch.setattr(store_module.time, "time", lambda: float(next(clock)))
+    value = np.zeros(2**14, dtype=np.uint8)  # ~16 KiB + header per entry
+    store = ArtifactStore(tmp_path, max_bytes=5 * 2**14 + 2000)
+
+    for k in range(5):
+        store.put(content_key(k), value)
+    store.get(content_key(0))  # now the most recent
+    store.put(content_key(5), value)
+
+    assert store.stats()["bytes"] <= store.max_bytes * store_module.EVICT_TO
+    assert store.get(content_key(0)) is not None
+    assert store.get(content_key(1)) is None
+    assert store.get(content_key(5)) is not None
+
+
+@pytest.mark.parametrize("age, touched", [(10.0, False), (120.0, True)])
+def test_hits_only_rewrite_stale_last_access(tmp_path, monkeypatch, age, touched):
+    now = [1000.0]
+    monkeypatch.setattr(store_module.time, "time", lambda: now[0])
+    store = ArtifactStore(tmp_path, max_bytes=2**20)
+    store.put("k", b"v")
+    now[0] += age
+    assert store.get("k") == b"v"
+    (last_access,) = store._db().execute("SELECT last_access FROM entries WHERE key = 'k'").fetchone()
+    assert last_access == (now[0] if touched else 1000.0)
+
+
+def test_fetch_returns_value_when_the_write_fails(tmp_path, monkeypatch):
+    store = ArtifactStore(tmp_path, max_bytes=2**20)
+
+    def vanished(src, dst):
+        raise FileNotFoundError(dst)
+    monkeypatch.setattr(store_module.os, "replace", vanished)
+    assert store.fetch(lambda: b"computed", "k") == b"computed"
+    assert store.stats()["entries"] == 0
+    assert not list(tmp_path.rglob("*.tmp"))